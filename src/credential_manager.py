@@ -4,14 +4,50 @@ Credential Manager
 Securely load and manage credentials for Granola API, Notion API, and LLM services.
 """
 
-import json
+import copy
+import functools
 import logging
 from pathlib import Path
 from typing import Any
 
+from json_utils import json_dumps_indented, json_loads
+
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_json_file(path: Path, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a JSON file, memoized on its modification time and size
+
+    The stat fields are only part of the cache key: a file that changes on disk
+    gets a new key and is re-read, so the cache never serves stale credentials.
+
+    Args:
+        path: Path to the JSON file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        Parsed JSON value
+    """
+    return json_loads(path.read_bytes())
+
+
+def _read_json(path: Path) -> Any:
+    """
+    Read a JSON file through the process-wide parse cache
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Private copy of the parsed JSON value, safe for the caller to mutate
+    """
+    stat = path.stat()
+    return copy.deepcopy(_parse_json_file(path, stat.st_mtime_ns, stat.st_size))
+
+
 class CredentialManager:
     """Manage credentials for all integrations"""
 
@@ -42,8 +78,7 @@ class CredentialManager:
         # If config file exists, merge it in (config file takes precedence)
         if self.config_path.exists():
             try:
-                with open(self.config_path) as f:
-                    config_creds = json.load(f)
+                config_creds = _read_json(self.config_path)
                 creds.update(config_creds)
                 logger.info(
                     f"Loaded config from {self.config_path} and merged with auto-discovered Granola credentials"
@@ -75,11 +110,10 @@ class CredentialManager:
             return {}
 
         try:
-            with open(granola_creds_path) as f:
-                data = json.load(f)
+            data = _read_json(granola_creds_path)
 
             # Parse the workos_tokens string into a dict
-            workos_tokens = json.loads(data["workos_tokens"])
+            workos_tokens = json_loads(data["workos_tokens"])
             access_token = workos_tokens.get("access_token")
             refresh_token = workos_tokens.get("refresh_token")
             expires_at = workos_tokens.get("expires_at")
@@ -219,8 +253,7 @@ class CredentialManager:
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            with open(self.config_path, "w") as f:
-                json.dump(self.credentials, f, indent=2)
+            self.config_path.write_text(json_dumps_indented(self.credentials), encoding="utf-8")
             logger.info(f"Credentials saved to {self.config_path}")
         except Exception as e:
             logger.error(f"Error saving credentials: {str(e)}")
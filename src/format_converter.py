@@ -16,10 +16,17 @@ ProseMirror structure:
 """
 
 import logging
+import re
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Runs of three or more newlines, collapsed to a single blank line in one pass
+_EXCESS_NEWLINES = re.compile(r"\n{3,}")
+
+# Inline mark type -> Markdown delimiter wrapped around the text (links are special-cased)
+_MARK_DELIMITERS = {"bold": "**", "italic": "*", "code": "`", "strike": "~~"}
+
 
 class ProseMirrorConverter:
     """Convert ProseMirror JSON to Markdown"""
@@ -57,8 +64,7 @@ class ProseMirrorConverter:
         markdown = "\n".join(self.output_lines)
 
         # Remove excessive blank lines (more than 2 in a row)
-        while "\n\n\n" in markdown:
-            markdown = markdown.replace("\n\n\n", "\n\n")
+        markdown = _EXCESS_NEWLINES.sub("\n\n", markdown)
 
         return markdown.strip()
 
@@ -72,29 +78,22 @@ class ProseMirrorConverter:
         """
         node_type = node.get("type")
 
-        if node_type == "heading":
-            self._convert_heading(node)
-        elif node_type == "paragraph":
+        # Paragraphs are by far the most common node and the only handler that
+        # cares about list context, so they skip the table lookup
+        if node_type == "paragraph":
             self._convert_paragraph(node, in_list_item)
-        elif node_type == "bulletList":
-            self._convert_bullet_list(node)
-        elif node_type == "orderedList":
-            self._convert_ordered_list(node)
-        elif node_type == "codeBlock":
-            self._convert_code_block(node)
-        elif node_type == "blockquote":
-            self._convert_blockquote(node)
-        elif node_type == "horizontalRule":
-            self.output_lines.append("---")
-            self.output_lines.append("")
-        elif node_type == "hardBreak":
-            self.output_lines.append("")
-        else:
-            logger.debug(f"Unhandled node type: {node_type}")
-            # Try to extract text anyway
-            text = self._extract_text(node.get("content", []))
-            if text.strip():
-                self.output_lines.append(text)
+            return
+
+        handler = self._NODE_HANDLERS.get(node_type)
+        if handler is not None:
+            handler(self, node)
+            return
+
+        logger.debug("Unhandled node type: %s", node_type)
+        # Try to extract text anyway
+        text = self._extract_text(node.get("content", []))
+        if text.strip():
+            self.output_lines.append(text)
 
     def _convert_heading(self, node: dict[str, Any]):
         """Convert heading node"""
@@ -203,6 +202,27 @@ class ProseMirrorConverter:
 
         self.output_lines.append("")
 
+    def _convert_horizontal_rule(self, node: dict[str, Any]):
+        """Convert horizontal rule node"""
+        self.output_lines.append("---")
+        self.output_lines.append("")
+
+    def _convert_hard_break(self, node: dict[str, Any]):
+        """Convert top-level hard break node"""
+        self.output_lines.append("")
+
+    # Block node type -> handler, built once at class creation so each node in the
+    # recursive walk costs a single dict lookup instead of an if/elif chain
+    _NODE_HANDLERS = {
+        "heading": _convert_heading,
+        "bulletList": _convert_bullet_list,
+        "orderedList": _convert_ordered_list,
+        "codeBlock": _convert_code_block,
+        "blockquote": _convert_blockquote,
+        "horizontalRule": _convert_horizontal_rule,
+        "hardBreak": _convert_hard_break,
+    }
+
     def _extract_text(self, content: list[dict[str, Any]], preserve_newlines: bool = False) -> str:
         """
         Recursively extract text from content nodes with formatting
@@ -226,18 +246,12 @@ class ProseMirrorConverter:
                 text = node.get("text", "")
 
                 # Apply marks (bold, italic, code, etc.)
-                marks = node.get("marks", [])
-                for mark in marks:
+                for mark in node.get("marks", ()):
                     mark_type = mark.get("type")
 
-                    if mark_type == "bold":
-                        text = f"**{text}**"
-                    elif mark_type == "italic":
-                        text = f"*{text}*"
-                    elif mark_type == "code":
-                        text = f"`{text}`"
-                    elif mark_type == "strike":
-                        text = f"~~{text}~~"
+                    wrap = _MARK_DELIMITERS.get(mark_type)
+                    if wrap is not None:
+                        text = f"{wrap}{text}{wrap}"
                     elif mark_type == "link":
                         href = mark.get("attrs", {}).get("href", "")
                         text = f"[{text}]({href})"
@@ -258,6 +272,22 @@ class ProseMirrorConverter:
         return "".join(text_parts)
 
 
+def _person_name(person: Any, name_key: str = "name") -> str | None:
+    """
+    Get a display name for a person dict
+
+    Args:
+        person: Person entry; anything other than a dict has no name
+        name_key: Dict key holding the display name
+
+    Returns:
+        Display name, falling back to email, or None if neither is present
+    """
+    if isinstance(person, dict):
+        return person.get(name_key) or person.get("email")
+    return None
+
+
 class MetadataExtractor:
     """Extract metadata from Granola document"""
 
@@ -282,37 +312,24 @@ class MetadataExtractor:
         }
 
         # Extract people/attendees
-        # People field is a dict with 'creator' and 'attendees' keys
+        # People field is a dict with 'creator' and 'attendees' keys; the creator comes
+        # first and repeat entries (e.g. creator also listed as attendee) are dropped
         people = doc.get("people", {})
-        attendees = []
-
+        names: list[str | None] = []
         if isinstance(people, dict):
-            # Get creator
-            creator = people.get("creator", {})
-            if isinstance(creator, dict):
-                creator_name = creator.get("name") or creator.get("email")
-                if creator_name:
-                    attendees.append(creator_name)
-
-            # Get attendees list
-            attendees_list = people.get("attendees", [])
-            for person in attendees_list:
-                if isinstance(person, dict):
-                    name = person.get("name") or person.get("email")
-                    if name:
-                        attendees.append(name)
-                elif isinstance(person, str):
-                    attendees.append(person)
+            names.append(_person_name(people.get("creator")))
+            # Only attendee entries may also be bare name strings
+            names.extend(
+                person if isinstance(person, str) else _person_name(person)
+                for person in people.get("attendees", [])
+            )
+        attendees = list(dict.fromkeys(filter(None, names)))
 
         # Fallback: Try Google Calendar attendees if available
         if not attendees:
-            gcal_event = doc.get("google_calendar_event", {})
-            gcal_attendees = gcal_event.get("attendees", [])
-            for person in gcal_attendees:
-                if isinstance(person, dict):
-                    name = person.get("displayName") or person.get("email")
-                    if name:
-                        attendees.append(name)
+            gcal_event = doc.get("google_calendar_event") or {}
+            gcal_names = (_person_name(p, "displayName") for p in gcal_event.get("attendees", []))
+            attendees = list(dict.fromkeys(filter(None, gcal_names)))
 
         metadata["attendees"] = attendees
 
@@ -39,6 +39,19 @@ class GranolaFetcher:
         if not self.token:
             raise ValueError("Granola access token not available")
 
+        # One keep-alive session for all API calls, so connection setup and the TLS
+        # handshake are paid once per run rather than per request
+        self.session = requests.Session()
+        self.session.headers.update(
+            {
+                "Authorization": f"Bearer {self.token}",
+                "Content-Type": "application/json",
+                "Accept": "*/*",
+                "User-Agent": f"Granola/{self.API_VERSION}",
+                "X-Client-Version": self.API_VERSION,
+            }
+        )
+
         self.last_check_file = Path("logs/.last_sync")
         logger.info("GranolaFetcher initialized")
 
@@ -58,14 +71,6 @@ class GranolaFetcher:
         """
         url = f"{self.API_BASE_URL}/get-documents"
 
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json",
-            "Accept": "*/*",
-            "User-Agent": f"Granola/{self.API_VERSION}",
-            "X-Client-Version": self.API_VERSION,
-        }
-
         payload = {"limit": limit, "offset": offset, "include_last_viewed_panel": True}
 
         # Add created_after filter if provided
@@ -75,7 +80,7 @@ class GranolaFetcher:
 
         try:
             logger.info(f"Fetching documents from Granola API (limit={limit}, offset={offset})")
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
+            response = self.session.post(url, json=payload, timeout=30)
             response.raise_for_status()
 
             data = response.json()
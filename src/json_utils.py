@@ -0,0 +1,47 @@
+"""
+JSON Utilities
+
+JSON encode/decode helpers that use orjson when it is installed and fall back
+to the standard library otherwise.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson  # Optional: faster JSON parsing/serialization
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def json_loads(data: str | bytes) -> Any:
+    """
+    Decode JSON with orjson when available
+
+    Args:
+        data: JSON document as text or UTF-8 bytes
+
+    Returns:
+        Decoded value
+
+    Raises:
+        json.JSONDecodeError: If the document is invalid (orjson's error subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_indented(obj: Any) -> str:
+    """
+    Encode JSON with 2-space indentation, using orjson when available
+
+    Args:
+        obj: JSON-serializable value
+
+    Returns:
+        Indented JSON text
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2)
@@ -8,15 +8,28 @@ Extracts structured data from meeting notes using Claude API:
 - People, projects, issues mentioned
 """
 
+import asyncio
 import json
 import logging
 import os
+import re
+from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic
 
 logger = logging.getLogger(__name__)
 
+# Maximum concurrent Claude requests when the CLI processes a batch of files
+MAX_CONCURRENT_REQUESTS = 8
+
+# Obsidian Tasks plugin priority emojis (read-only, shared across calls)
+_PRIORITY_EMOJI = MappingProxyType({"high": "⏫", "medium": "🔽", "low": "⏬"})
+
+# YAML frontmatter block followed by the note body
+_FRONTMATTER = re.compile(r"^---\n(.*?)\n---\n(.*)$", re.DOTALL)
+
 
 class LLMParser:
     """Parse meeting notes using Claude API"""
@@ -33,10 +46,18 @@ class LLMParser:
             raise ValueError("Anthropic API key required (set ANTHROPIC_API_KEY env var)")
 
         self.client = Anthropic(api_key=self.api_key)
+        self._async_client: AsyncAnthropic | None = None
         self.model = "claude-3-5-sonnet-20241022"
 
         logger.info("LLMParser initialized")
 
+    @property
+    def async_client(self) -> AsyncAnthropic:
+        """AsyncAnthropic client, created on first async use"""
+        if self._async_client is None:
+            self._async_client = AsyncAnthropic(api_key=self.api_key)
+        return self._async_client
+
     def parse_meeting(self, markdown_content: str, metadata: dict[str, Any]) -> dict[str, Any]:
         """
         Parse meeting notes to extract structured data
@@ -49,40 +70,90 @@ class LLMParser:
             Dictionary with extracted action items, decisions, topics, entities
         """
         try:
-            prompt = self._build_extraction_prompt(markdown_content, metadata)
-
-            logger.info(f"Parsing meeting: {metadata.get('title', 'Untitled')}")
-            logger.debug(f"Prompt length: {len(prompt)} chars")
-
             response = self.client.messages.create(
-                model=self.model,
-                max_tokens=4000,
-                temperature=0,
-                messages=[{"role": "user", "content": prompt}],
+                **self._build_request(markdown_content, metadata)
             )
+            return self._decode_response(response)
 
-            # Extract JSON from response
-            response_text = response.content[0].text
-            logger.debug(f"Response length: {len(response_text)} chars")
+        except json.JSONDecodeError:
+            raise
+        except Exception as e:
+            logger.error(f"Error parsing meeting: {e}")
+            raise
 
-            # Parse JSON
-            parsed_data = json.loads(response_text)
+    async def parse_meeting_async(
+        self, markdown_content: str, metadata: dict[str, Any]
+    ) -> dict[str, Any]:
+        """
+        Async variant of parse_meeting for processing many meetings concurrently
 
-            logger.info(
-                f"Successfully parsed meeting: {len(parsed_data.get('action_items', []))} actions, "
-                f"{len(parsed_data.get('decisions', []))} decisions"
-            )
+        Args:
+            markdown_content: The meeting notes in markdown format
+            metadata: Meeting metadata (title, date, attendees, etc.)
+
+        Returns:
+            Dictionary with extracted action items, decisions, topics, entities
+        """
+        response = await self.async_client.messages.create(
+            **self._build_request(markdown_content, metadata)
+        )
+        return self._decode_response(response)
+
+    def _build_request(self, markdown_content: str, metadata: dict[str, Any]) -> dict[str, Any]:
+        """
+        Build the messages.create arguments shared by the sync and async paths
 
-            return parsed_data
+        Args:
+            markdown_content: The meeting notes in markdown format
+            metadata: Meeting metadata (title, date, attendees, etc.)
 
+        Returns:
+            Keyword arguments for messages.create
+        """
+        prompt = self._build_extraction_prompt(markdown_content, metadata)
+
+        logger.info("Parsing meeting: %s", metadata.get("title", "Untitled"))
+        logger.debug("Prompt length: %d chars", len(prompt))
+
+        return {
+            "model": self.model,
+            "max_tokens": 4000,
+            "temperature": 0,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+
+    def _decode_response(self, response: Any) -> dict[str, Any]:
+        """
+        Decode the JSON extraction from a Claude response
+
+        Args:
+            response: messages.create response
+
+        Returns:
+            Dictionary with extracted action items, decisions, topics, entities
+
+        Raises:
+            json.JSONDecodeError: If the response text is not valid JSON
+        """
+        # Extract JSON from response
+        response_text = response.content[0].text
+        logger.debug("Response length: %d chars", len(response_text))
+
+        try:
+            parsed_data: dict[str, Any] = json.loads(response_text)
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON response: {e}")
-            logger.debug(f"Response text: {response_text[:500]}")
-            raise
-        except Exception as e:
-            logger.error(f"Error parsing meeting: {e}")
+            logger.debug("Response text: %.500s", response_text)
             raise
 
+        logger.info(
+            "Successfully parsed meeting: %d actions, %d decisions",
+            len(parsed_data.get("action_items", [])),
+            len(parsed_data.get("decisions", [])),
+        )
+
+        return parsed_data
+
     def _build_extraction_prompt(self, markdown_content: str, metadata: dict[str, Any]) -> str:
         """
         Build the extraction prompt for Claude
@@ -232,7 +303,7 @@ Return the JSON now:"""
                 priority = item.get("priority", "medium")
 
                 # Format task with Obsidian Tasks plugin emoji format
-                priority_emoji = {"high": "⏫", "medium": "🔽", "low": "⏬"}.get(priority, "")
+                priority_emoji = _PRIORITY_EMOJI.get(priority, "")
 
                 due_emoji = f" 📅 {due_date}" if due_date else ""
 
@@ -306,47 +377,157 @@ Return the JSON now:"""
         return "".join(sections)
 
 
+def _load_note(file_path: Path) -> tuple[dict[str, Any], str, str | None]:
+    """
+    Split a meeting note into metadata, markdown body and raw frontmatter
+
+    Args:
+        file_path: Path to meeting note markdown file
+
+    Returns:
+        Tuple of (metadata, markdown content, raw frontmatter or None)
+    """
+    content = file_path.read_text(encoding="utf-8")
+
+    # Extract metadata from frontmatter (simple parser)
+    frontmatter_match = _FRONTMATTER.match(content)
+
+    if frontmatter_match:
+        import yaml
+
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        metadata = yaml.load(frontmatter_match.group(1), Loader=loader)
+        return metadata, frontmatter_match.group(2), frontmatter_match.group(1)
+
+    return {"title": file_path.stem}, content, None
+
+
+def _write_enriched(
+    llm: LLMParser,
+    file_path: Path,
+    markdown_content: str,
+    metadata: dict[str, Any],
+    parsed: dict[str, Any],
+    frontmatter: str | None,
+) -> Path:
+    """
+    Write the enriched note next to the source file
+
+    Returns:
+        Path to the enriched note
+    """
+    enriched = llm.enrich_meeting_note(markdown_content, metadata, parsed)
+    enriched_path = file_path.parent / f"{file_path.stem}_enriched.md"
+
+    # Reconstruct with frontmatter
+    full_content = f"---\n{frontmatter}\n---\n\n{enriched}" if frontmatter is not None else enriched
+
+    enriched_path.write_text(full_content, encoding="utf-8")
+
+    return enriched_path
+
+
+async def _process_files(llm: LLMParser, paths: list[Path], enrich: bool) -> int:
+    """
+    Parse many meeting notes concurrently
+
+    Requests are bounded by MAX_CONCURRENT_REQUESTS to respect Anthropic rate
+    limits. Parsed JSON is written next to each source as <stem>_parsed.json.
+
+    Args:
+        llm: LLMParser instance
+        paths: Meeting note files to process
+        enrich: Also write enriched markdown for each file
+
+    Returns:
+        Number of files that failed
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    failed = 0
+
+    async def process(file_path: Path) -> None:
+        nonlocal failed
+        try:
+            metadata, markdown_content, frontmatter = await asyncio.to_thread(_load_note, file_path)
+
+            # Notes the processor already enriched carry their LLM output; don't re-parse them
+            if metadata and metadata.get("llm_enriched"):
+                print(f"Already enriched, skipping: {file_path}")
+                return
+
+            async with semaphore:
+                parsed = await llm.parse_meeting_async(markdown_content, metadata)
+
+            output_path = file_path.parent / f"{file_path.stem}_parsed.json"
+            await asyncio.to_thread(
+                output_path.write_text, json.dumps(parsed, indent=2), encoding="utf-8"
+            )
+            print(f"Parsed data written to: {output_path}")
+
+            if enrich:
+                enriched_path = await asyncio.to_thread(
+                    _write_enriched, llm, file_path, markdown_content, metadata, parsed, frontmatter
+                )
+                print(f"Enriched note written to: {enriched_path}")
+
+        except Exception as e:
+            failed += 1
+            logger.error(f"Error processing {file_path}: {e}")
+
+    async with asyncio.TaskGroup() as tg:
+        for file_path in paths:
+            tg.create_task(process(file_path))
+
+    return failed
+
+
 def main():
     """CLI for testing LLM parser"""
     import argparse
-    from pathlib import Path
 
     logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
     parser = argparse.ArgumentParser(description="Parse meeting notes with LLM")
-    parser.add_argument(
-        "--file", type=str, required=True, help="Path to meeting note markdown file"
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--file", type=str, help="Path to meeting note markdown file")
+    source.add_argument(
+        "--files",
+        type=str,
+        metavar="GLOB",
+        help="Glob of meeting note files to process concurrently (e.g. 'notes/*.md')",
     )
     parser.add_argument("--output", type=str, help="Output file for parsed JSON")
     parser.add_argument("--enrich", action="store_true", help="Generate enriched markdown")
 
     args = parser.parse_args()
 
+    llm = LLMParser()
+
+    # Batch mode: process all matching files concurrently
+    if args.files:
+        pattern = Path(args.files).expanduser()
+        root = Path(pattern.anchor) if pattern.is_absolute() else Path()
+        # Skip our own *_enriched.md outputs, as the Perplexity parser's --batch does
+        paths = sorted(
+            p for p in root.glob(str(pattern.relative_to(root))) if not p.stem.endswith("_enriched")
+        )
+        if not paths:
+            print(f"Error: No files match: {args.files}")
+            return
+
+        failed = asyncio.run(_process_files(llm, paths, args.enrich))
+        print(f"Processed {len(paths) - failed}/{len(paths)} files")
+        return
+
     # Read file
     file_path = Path(args.file)
     if not file_path.exists():
         print(f"Error: File not found: {file_path}")
         return
 
-    with open(file_path, encoding="utf-8") as f:
-        content = f.read()
-
-    # Extract metadata from frontmatter (simple parser)
-    import re
-
-    frontmatter_match = re.match(r"^---\n(.*?)\n---\n(.*)$", content, re.DOTALL)
-
-    if frontmatter_match:
-        import yaml
-
-        metadata = yaml.safe_load(frontmatter_match.group(1))
-        markdown_content = frontmatter_match.group(2)
-    else:
-        metadata = {"title": file_path.stem}
-        markdown_content = content
+    metadata, markdown_content, frontmatter = _load_note(file_path)
 
     # Parse with LLM
-    llm = LLMParser()
     parsed = llm.parse_meeting(markdown_content, metadata)
 
     # Output
@@ -359,18 +540,9 @@ def main():
 
     # Generate enriched note
     if args.enrich:
-        enriched = llm.enrich_meeting_note(markdown_content, metadata, parsed)
-        enriched_path = file_path.parent / f"{file_path.stem}_enriched.md"
-
-        # Reconstruct with frontmatter
-        if frontmatter_match:
-            full_content = f"---\n{frontmatter_match.group(1)}\n---\n\n{enriched}"
-        else:
-            full_content = enriched
-
-        with open(enriched_path, "w", encoding="utf-8") as f:
-            f.write(full_content)
-
+        enriched_path = _write_enriched(
+            llm, file_path, markdown_content, metadata, parsed, frontmatter
+        )
         print(f"Enriched note written to: {enriched_path}")
 
 
@@ -8,20 +8,483 @@ Extracts structured data from meeting notes using Perplexity API with JSON Schem
 - People, projects, issues mentioned
 """
 
+import asyncio
+import difflib
+import functools
+import hashlib
+import importlib.util
 import json
 import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-from openai import OpenAI  # Perplexity uses OpenAI-compatible SDK
+from openai import AsyncOpenAI, DefaultHttpxClient, OpenAI  # Perplexity: OpenAI-compatible SDK
+
+from json_utils import json_dumps_indented, json_loads
+
+try:
+    import fastjsonschema  # Optional: client-side validation of extraction responses
+except ImportError:
+    fastjsonschema = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
+# Obsidian Tasks plugin priority emojis (read-only, shared across calls)
+_PRIORITY_EMOJI = MappingProxyType({"high": "⏫", "medium": "🔽", "low": "⏬"})
+
+# On-disk cache of LLM responses keyed by (model, prompt, response format).
+# Set LLM_PARSER_NOCACHE=1 to always call the API.
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "task-centralization" / "llm"
+
+# Cached responses older than this are ignored on read and deleted by the first
+# cache write of each parser, so the cache directory does not grow without bound
+CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Default number of in-flight Perplexity requests when parsing a batch
+DEFAULT_MAX_CONCURRENCY = 8
+
+PERPLEXITY_BASE_URL = "https://api.perplexity.ai"
+
+# Multiplex requests over one connection when the optional h2 package is installed
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Notes estimated above this many input tokens are condensed section-by-section
+# with a cheaper model before extraction (rough estimate: ~4 chars per token)
+CONDENSE_THRESHOLD_TOKENS = 6000
+CHARS_PER_TOKEN = 4
+CONDENSE_MODEL = "sonar"
+
+# Action items whose task text is at least this similar (same assignee) are
+# merged locally before deciding whether the consolidation fallback is needed
+DEDUP_SIMILARITY = 0.9
+
+# Notes with fewer non-whitespace characters than this and no list items or
+# headings are treated as empty and never sent to the API
+MIN_CONTENT_CHARS = 300
+
+# Processor-built notes wrap the converted Granola content between this heading
+# and a closing footer rule; only that section is checked for triviality
+_NOTES_HEADING = "\n## Notes\n"
+_FOOTER_RULE = "\n---\n"
+
+_SUMMARY_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "section_summary",
+        "schema": {
+            "type": "object",
+            "properties": {"summary": {"type": "string"}},
+            "required": ["summary"],
+        },
+    },
+}
+
+
+@functools.cache
+def _shared_client(api_key: str) -> OpenAI:
+    """
+    Return the process-wide Perplexity client for an API key
+
+    Parser instances share one client (and its connection pool and TLS
+    sessions) instead of each opening their own.
+
+    Args:
+        api_key: Perplexity API key
+
+    Returns:
+        OpenAI-compatible client pointed at Perplexity
+    """
+    return OpenAI(
+        api_key=api_key,
+        base_url=PERPLEXITY_BASE_URL,
+        http_client=DefaultHttpxClient(http2=_HTTP2_AVAILABLE),
+    )
+
+
+def _empty_extraction() -> dict[str, Any]:
+    """Return an extraction result with every section empty"""
+    return {
+        "action_items": [],
+        "decisions": [],
+        "topics": [],
+        "entities": {
+            "people": [],
+            "projects": [],
+            "issues": [],
+            "companies": [],
+            "technologies": [],
+        },
+        "follow_ups": [],
+        "open_questions": [],
+    }
+
+
+def _is_trivial_note(markdown_content: str) -> bool:
+    """
+    Check whether a note is too small to contain anything worth extracting
+
+    A note is trivial when it has fewer than MIN_CONTENT_CHARS non-whitespace
+    characters and no list items or headings (e.g. "_No content available_").
+    For notes in the processor's layout only the "## Notes" section counts, so
+    the generated title, header and footer do not make an empty note look
+    structured.
+    """
+    content = _notes_section(markdown_content)
+    if sum(not c.isspace() for c in content) >= MIN_CONTENT_CHARS:
+        return False
+
+    return not any(line.lstrip().startswith(("- ", "* ", "#")) for line in content.splitlines())
+
+
+def _notes_section(markdown_content: str) -> str:
+    """
+    Get the converted meeting content from a processor-built note body
+
+    Args:
+        markdown_content: Note body, or bare meeting markdown
+
+    Returns:
+        Text between the "## Notes" heading and the footer rule, or the input
+        unchanged when it has no "## Notes" heading
+    """
+    start = markdown_content.find(_NOTES_HEADING)
+    if start == -1:
+        return markdown_content
+
+    section = markdown_content[start + len(_NOTES_HEADING) :]
+    end = section.rfind(_FOOTER_RULE)
+    return section if end == -1 else section[:end]
+
+
+def _local_dedup(actions: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Merge near-duplicate action items without an LLM call
+
+    Items are duplicates when they share an assignee and their lower-cased task
+    text has a SequenceMatcher ratio of at least DEDUP_SIMILARITY. The first
+    occurrence is kept and the contexts of later duplicates are appended to it.
+
+    Args:
+        actions: Action items from the extraction pass
+
+    Returns:
+        Deduplicated action items, in original order
+    """
+    accepted: list[dict[str, Any]] = []
+    keys: list[tuple[str, str]] = []
+
+    for item in actions:
+        task = str(item.get("task", "")).lower()
+        assignee = str(item.get("assignee", "")).lower()
+        matcher = difflib.SequenceMatcher(None, b=task)
+
+        for kept, (kept_task, kept_assignee) in zip(accepted, keys, strict=True):
+            if kept_assignee != assignee:
+                continue
+            matcher.set_seq1(kept_task)
+            if matcher.quick_ratio() >= DEDUP_SIMILARITY and matcher.ratio() >= DEDUP_SIMILARITY:
+                context = item.get("context")
+                if context and context != kept.get("context"):
+                    kept["context"] = (
+                        f"{kept['context']}; {context}" if kept.get("context") else context
+                    )
+                break
+        else:
+            accepted.append(dict(item))
+            keys.append((task, assignee))
+
+    return accepted
+
+
+def _wikilinks(names: list[str]) -> str:
+    """Format names as a comma-separated list of [[WikiLinks]]"""
+    return ", ".join(f"[[{name}]]" for name in names)
+
+
+def _action_item_columns(items: list[dict[str, Any]]) -> tuple[list[Any], ...]:
+    """
+    Transpose action items into per-field columns (applying render defaults)
+
+    Args:
+        items: Action items as returned by the LLM
+
+    Returns:
+        Tuple of columns: tasks, assignees, priority emojis, due dates, contexts,
+        mentioned_by, related entities
+    """
+    return (
+        [item["task"] for item in items],
+        [item.get("assignee", "unassigned") for item in items],
+        [_PRIORITY_EMOJI.get(item.get("priority", "medium"), "") for item in items],
+        [item.get("due_date") for item in items],
+        [item.get("context", "") for item in items],
+        [item.get("mentioned_by") for item in items],
+        [item.get("related_entities") for item in items],
+    )
+
+
+def _format_action_item(
+    task: str,
+    assignee: str,
+    priority_emoji: str,
+    due_date: str | None,
+    context: str,
+    mentioned_by: str | None,
+    related: list[str] | None,
+) -> str:
+    """Render one action item in Obsidian Tasks plugin format"""
+    due_emoji = f" 📅 {due_date}" if due_date else ""
+
+    context_line = f"  - **Context**: {context}\n" if context else ""
+    mentioned_line = f"  - **Mentioned by**: {mentioned_by}\n" if mentioned_by else ""
+    related_line = f"  - **Related**: {_wikilinks(related)}\n" if related else ""
+
+    return (
+        f"### @{assignee}\n"
+        f"- [ ] {task} {priority_emoji}{due_emoji}\n"
+        f"{context_line}{mentioned_line}{related_line}\n"
+    )
+
+
+def _format_decision(decision: dict[str, Any]) -> str:
+    """Render one decision with its rationale, alternatives, impact and owner"""
+    alternatives = decision.get("alternatives_considered")
+    impact = decision.get("impact")
+    owner = decision.get("owner")
+
+    alternatives_block = (
+        "**Alternatives considered**:\n" + "".join(f"- {alt}\n" for alt in alternatives) + "\n"
+        if alternatives
+        else ""
+    )
+    impact_block = f"**Impact**: {impact}\n\n" if impact else ""
+    owner_block = f"**Owner**: [[{owner}]]\n\n" if owner else ""
+
+    return (
+        f"### {decision['decision']}\n\n"
+        f"**Rationale**: {decision.get('rationale', 'Not specified')}\n\n"
+        f"{alternatives_block}{impact_block}{owner_block}"
+    )
+
+
+def _format_follow_up(item: dict[str, Any]) -> str:
+    """Render one follow-up line with owner and optional timing"""
+    timing = item.get("timing", "")
+    timing_str = f" ({timing})" if timing else ""
+    return f"- **@{item.get('owner', 'unassigned')}**: {item['item']}{timing_str}\n"
+
+
+# Static instructions are sent as system messages ahead of the per-meeting
+# content, so every request shares a byte-identical prefix that the API can
+# serve from its prompt cache.
+_SYSTEM_PROMPT_EXTRACT = """You are an expert at analyzing meeting notes and extracting actionable information with exceptional attention to detail.
+
+# Task
+Extract ALL actionable information from the meeting notes in the user message. Be THOROUGH - this is production data that people rely on.
+
+## 1. Action Items - BE SELECTIVE (Quality over Quantity)
+
+**What counts as an action item** (IMPORTANT - Don't confuse decisions with actions):
+
+✅ **YES - Extract as action item**:
+- Standalone work that needs to be done: "Update Sidekick to collect phone numbers"
+- Investigation/exploration tasks: "Consider better product naming"
+- Reviews and validations: "Complete QA review"
+- Documentation work: "Create centralized terminology documentation"
+- High-level implementation: "Implement logic for MSO integrated shops"
+- Bug fixes and releases: "Compile must-have bug fixes"
+
+❌ **NO - This is a DECISION, not an action item**:
+- UI copy changes: "Replace 'car' with 'vehicle'" (this is a decision detail, not a task)
+- Button labels: "Use 'Accept shop referral' button" (design decision)
+- Field requirements: "Make drop-off date mandatory" (requirement decision)
+- Visual changes: "Add car icon to map pin" (design decision)
+- Removal of features: "Remove 'View other recommendations'" (design decision)
+
+**The distinction**:
+- **Decision** = What we decided to do (goes in Decisions section)
+- **Action item** = Who needs to do work to implement decisions (could be one action for many decisions)
+
+**Example**:
+- Meeting discusses: "Use button X", "Change label Y", "Remove field Z"
+- **Decisions**: 3 separate decisions (document what was decided)
+- **Action items**: 1 action item = "Update UI based on design decisions" (the actual work)
+
+**Assignee detection** (CRITICAL - don't mark everything "unassigned"):
+- "I'll..." or "I will..." → speaker (check context for who's speaking)
+- "Sam will review" → Sam
+- "[Name] needs to..." → that person
+- "We should..." + specific domain → assign to relevant attendee or "team"
+- Only use "unassigned" if truly impossible to determine
+
+**Priority assignment**:
+- **high**: Has deadline, blocks work, "must-have", related to imminent release
+- **medium**: Standard tasks, process improvements, no urgency stated
+- **low**: "Consider", "nice to have", exploratory, long-term
+
+**Context**: Include WHY the task matters, dependencies, blockers
+
+**Consolidate before returning** (Target: 8-15 high-quality action items):
+1. **Remove duplicates** - If multiple items describe the same work, merge them
+2. **Remove decision details** - Drop items that just implement a decision if a broader implementation task covers them
+3. **Group related items** - Combine small related tasks into logical work items
+4. **Preserve critical items** - Keep distinct work items that are truly separate, with their assignees, priorities, and context
+
+**Examples of consolidation**:
+- "Replace 'car' with 'vehicle' in designs" + "Change 'Shop appointment' to 'Shop details'" + "Update button label to 'Accept shop referral'"
+  → "Update UI copy and terminology based on design decisions"
+- "Implement MSO shop logic" + "Prevent appointment booking for vehicles at shop"
+  → "Implement MSO shop logic to prevent appointment booking for vehicles already at shop"
+
+## 2. Decisions - CAPTURE ALL (not just major ones)
+
+Look for:
+- "Use [X] button" (UI decision)
+- "Make [X] mandatory" (requirement decision)
+- "Replace [X] with [Y]" (terminology decision)
+- "Remove [X]" (removal decision)
+- ANY conclusive statement about how to proceed
+
+**Rationale**: Explain WHY, not just "for consistency"
+- "Use 'Accept shop referral' for consistency with existing button patterns in the app"
+- Include constraints, requirements, user impact
+
+**Alternatives**: Look for "instead of", "rather than", "not using", "remove X since Y"
+
+## 3. Topics - Group logically
+Extract 3-5 major themes and their key points
+
+## 4. Entities - BE EXHAUSTIVE
+
+**People**: ANYONE mentioned, even in passing (beyond attendees)
+
+**Projects/Products** - Extract ALL:
+- Abbreviations: SAR, NSF, VAS, GPC, MSO, ERAC, FNOL, PEG, etc.
+- Full names: "Service Assignment", "Self-service", etc.
+- Features: "Network shop flow", "Sidekick", "virtual estimate"
+
+**Companies**: Progressive, Enterprise, Agero, etc.
+
+**Technologies/Systems**:
+- "Google API", "Granola API", "Notion"
+- Internal systems: "MSO", "Sidekick"
+- Features: "GPC", "virtual estimate"
+
+**Issues**: ABC-123 patterns (ISA-234, etc.)
+
+## 5. Follow-ups & Open Questions
+
+**Follow-ups**: Items explicitly needing future discussion
+
+**Open Questions**: Questions with "?" that weren't answered
+- "When a vehicle is at a shop and customer accepts ERAC, how do they receive the rental?"
+- "How does Enterprise coordination work?"
+
+## Success Criteria (Target for this meeting)
+- ✅ 8-15 action items (actual work items, not decision details!)
+- ✅ 5-15 decisions (include small ones - this is where UI changes go!)
+- ✅ 20-40 entities (be comprehensive!)
+- ✅ Specific assignees where possible (not all "unassigned")
+- ✅ 3-7 open questions
+
+Remember: QUALITY over QUANTITY. Don't duplicate decisions as action items."""
+
+# {action_item_schema} is filled in once per parser instance
+_SYSTEM_PROMPT_CONSOLIDATE = """You are reviewing extracted action items from a meeting to consolidate and refine them.
+
+# Task
+Review the action items and consolidate them. Return a refined list that:
+
+1. **Removes duplicates** - If multiple items describe the same work, merge them
+2. **Removes decision details** - If an item is just implementing a decision (like "Change button label X"), either:
+   - Remove it if it's covered by a broader implementation task
+   - Keep it if it's a standalone work item
+3. **Groups related items** - Combine small related tasks into logical work items
+4. **Preserves critical items** - Keep distinct work items that are truly separate
+
+**Examples of consolidation**:
+
+Before:
+- "Replace 'car' with 'vehicle' in designs"
+- "Change 'Shop appointment' to 'Shop details'"
+- "Update button label to 'Accept shop referral'"
+
+After:
+- "Update UI copy and terminology based on design decisions" (combines all copy changes)
+
+Before:
+- "Implement MSO shop logic"
+- "Prevent appointment booking for vehicles at shop"
+
+After:
+- "Implement MSO shop logic to prevent appointment booking for vehicles already at shop" (merged related)
+
+**Guidelines**:
+- Target: 8-15 high-quality action items
+- Each action should be a distinct work item requiring effort
+- Preserve assignees, priorities, and context
+- Don't lose important details - just consolidate redundant ones
+
+Return the consolidated action items as a JSON array matching this schema:
+{action_item_schema}
+
+Return ONLY the JSON array, no other text."""
+
+# Per-meeting user messages (filled with str.format_map)
+_EXTRACTION_TEMPLATE = """# Meeting Context
+- **Title**: {meeting_title}
+- **Date**: {meeting_date}
+- **Attendees**: {attendees_str}
+
+# Meeting Notes
+{markdown_content}"""
+
+_CONSOLIDATION_TEMPLATE = """# Meeting: {meeting_title}
+
+# Extracted Action Items (Initial Pass)
+{actions_json}
+
+# Extracted Decisions (for context)
+{decisions_json}"""
+
+_SECTION_SUMMARY_TEMPLATE = """Summarize this section of meeting notes for later extraction of action items, decisions, people, projects and open questions.
+
+Keep every name, assignee, date, deadline, number, issue ID (like ABC-123), decision and question. Drop filler and repetition.
+
+{section}"""
+
+# Hash of every prompt text that shapes a parse; part of the CLI sidecar cache key
+# (<note>.md.cache.json) so editing any prompt invalidates cached parses
+_PROMPTS_DIGEST = hashlib.sha256(
+    "\0".join(
+        [
+            _SYSTEM_PROMPT_EXTRACT,
+            _SYSTEM_PROMPT_CONSOLIDATE,
+            _EXTRACTION_TEMPLATE,
+            _CONSOLIDATION_TEMPLATE,
+            _SECTION_SUMMARY_TEMPLATE,
+        ]
+    ).encode("utf-8")
+).hexdigest()
+
 
 class LLMParser:
     """Parse meeting notes using Perplexity API"""
 
-    def __init__(self, api_key: str | None = None, model: str | None = None):
+    # The extraction prompt asks for consolidated action items (target 8-15). A
+    # separate consolidation call is only made if the model overshoots this count.
+    CONSOLIDATION_FALLBACK_THRESHOLD = 20
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        model: str | None = None,
+        cache_dir: Path | None = DEFAULT_CACHE_DIR,
+    ):
         """
         Initialize LLM parser with Perplexity API
 
@@ -29,21 +492,249 @@ class LLMParser:
             api_key: Perplexity API key (defaults to PERPLEXITY_API_KEY env var)
             model: Perplexity model to use (defaults to sonar-pro)
                    Options: sonar, sonar-pro, sonar-reasoning, sonar-reasoning-pro
+            cache_dir: Directory for cached LLM responses (None disables caching)
         """
         self.api_key = api_key or os.getenv("PERPLEXITY_API_KEY")
         if not self.api_key:
             raise ValueError("Perplexity API key required (set PERPLEXITY_API_KEY env var)")
 
-        # Perplexity uses OpenAI-compatible API
-        self.client = OpenAI(api_key=self.api_key, base_url="https://api.perplexity.ai")
+        # Perplexity uses OpenAI-compatible API; the client is shared per API key
+        self.client = _shared_client(self.api_key)
+        # Async client is created per batch run (see parse_meetings_batch)
+        self.async_client: AsyncOpenAI | None = None
         self.model = model or "sonar-pro"  # Default to sonar-pro for structured outputs
 
-        logger.info(f"LLMParser initialized (Perplexity {self.model})")
+        # Build the schema once; the action-items sub-schema is pre-serialized for
+        # embedding in the consolidation prompt
+        self._schema = self._build_schema()
+        self._action_item_schema_str = json.dumps(self._schema["properties"]["action_items"])
+        self._consolidate_system_prompt = _SYSTEM_PROMPT_CONSOLIDATE.format(
+            action_item_schema=self._action_item_schema_str
+        )
+        self._response_format = {
+            "type": "json_schema",
+            "json_schema": {"name": "meeting_extraction", "schema": self._schema},
+        }
+        # Compiled validator (None if fastjsonschema is not installed)
+        self._validate = fastjsonschema.compile(self._schema) if fastjsonschema else None
+
+        if os.getenv("LLM_PARSER_NOCACHE") == "1":
+            cache_dir = None
+        self.cache_dir = cache_dir
+        # Expired entries are swept once, on this parser's first cache write
+        self._cache_pruned = False
+
+        logger.info("LLMParser initialized (Perplexity %s)", self.model)
+
+    def _cache_file(
+        self,
+        prompt: str,
+        response_format: dict[str, Any] | None,
+        model: str,
+        system: str | None,
+    ) -> Path | None:
+        """
+        Get the cache file for a request, or None if caching is disabled
+
+        Args:
+            prompt: User prompt
+            response_format: Optional structured-output response format
+            model: Model the request is sent to
+            system: Optional system prompt
+
+        Returns:
+            Path to the cache entry for this (model, system, prompt, response format)
+        """
+        if not self.cache_dir:
+            return None
+
+        key_source = json.dumps([model, system, prompt, response_format], sort_keys=True)
+        key = hashlib.blake2b(key_source.encode("utf-8"), digest_size=32).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    def _read_cache(self, cache_file: Path | None) -> Any | None:
+        """
+        Read a cached response
+
+        Returns:
+            Decoded cached response, or None on a miss, expired or unreadable entry
+        """
+        if not cache_file:
+            return None
+
+        try:
+            if time.time() - cache_file.stat().st_mtime > CACHE_TTL_SECONDS:
+                return None
+            cached = json_loads(cache_file.read_bytes())
+            logger.debug("LLM cache hit: %s", cache_file.stem)
+            return cached
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable LLM cache entry {cache_file}: {e}")
+            return None
+
+    def _write_cache(self, cache_file: Path | None, response_text: str) -> None:
+        """Store a successfully decoded response in the cache"""
+        if not cache_file:
+            return
+
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(response_text, encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"Failed to write LLM cache entry: {e}")
+            return
+
+        if not self._cache_pruned:
+            self._cache_pruned = True
+            self._prune_cache(cache_file.parent)
+
+    @staticmethod
+    def _prune_cache(cache_dir: Path) -> None:
+        """
+        Delete cached responses older than CACHE_TTL_SECONDS
+
+        Args:
+            cache_dir: Response cache directory
+        """
+        cutoff = time.time() - CACHE_TTL_SECONDS
+        removed = 0
+        for entry in cache_dir.glob("*.json"):
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    entry.unlink()
+                    removed += 1
+            except OSError:
+                # Entry vanished or is not removable; the next sweep retries
+                continue
+        if removed:
+            logger.info("Pruned %d expired LLM cache entries", removed)
+
+    def _chat_request(
+        self,
+        prompt: str,
+        response_format: dict[str, Any] | None,
+        model: str,
+        system: str | None,
+    ) -> dict[str, Any]:
+        """Build streaming chat completion arguments for a single-turn prompt"""
+        messages = [{"role": "user", "content": prompt}]
+        if system:
+            messages.insert(0, {"role": "system", "content": system})
+
+        request: dict[str, Any] = {
+            "model": model,
+            "messages": messages,
+            "temperature": 0,
+            "stream": True,
+        }
+        if response_format:
+            request["response_format"] = response_format
+        return request
+
+    def _cached_chat_json(
+        self,
+        prompt: str,
+        response_format: dict[str, Any] | None = None,
+        model: str | None = None,
+        system: str | None = None,
+    ) -> Any:
+        """
+        Run a single-turn chat completion and decode its JSON response
+
+        Identical requests are served from the on-disk cache. Only responses that
+        decode successfully are cached, so a malformed reply is retried next run.
+
+        Args:
+            prompt: User prompt
+            response_format: Optional structured-output response format
+            model: Model override (defaults to the parser's model)
+            system: Optional static system prompt sent ahead of the user prompt
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            json.JSONDecodeError: If the response is not valid JSON
+        """
+        model = model or self.model
+        cache_file = self._cache_file(prompt, response_format, model, system)
+        cached = self._read_cache(cache_file)
+        if cached is not None:
+            return cached
+
+        # Stream tokens so long responses don't sit behind a single blocking read;
+        # chunks are collected and joined once the stream ends
+        stream = self.client.chat.completions.create(
+            **self._chat_request(prompt, response_format, model, system)
+        )
+        parts: list[str] = []
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+
+        response_text = "".join(parts)
+        logger.debug("Response length: %d chars (%d chunks)", len(response_text), len(parts))
+
+        data = json_loads(response_text)
+        self._write_cache(cache_file, response_text)
+        return data
+
+    async def _cached_chat_json_async(
+        self,
+        prompt: str,
+        response_format: dict[str, Any] | None = None,
+        system: str | None = None,
+    ) -> Any:
+        """
+        Async variant of _cached_chat_json using the batch's AsyncOpenAI client
+
+        Args:
+            prompt: User prompt
+            response_format: Optional structured-output response format
+            system: Optional static system prompt sent ahead of the user prompt
+
+        Returns:
+            Decoded JSON response
+        """
+        cache_file = self._cache_file(prompt, response_format, self.model, system)
+        cached = self._read_cache(cache_file)
+        if cached is not None:
+            return cached
+
+        if self.async_client is None:
+            self.async_client = AsyncOpenAI(api_key=self.api_key, base_url=PERPLEXITY_BASE_URL)
+
+        stream = await self.async_client.chat.completions.create(
+            **self._chat_request(prompt, response_format, self.model, system)
+        )
+        parts: list[str] = []
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+
+        response_text = "".join(parts)
+        logger.debug("Response length: %d chars (%d chunks)", len(response_text), len(parts))
+
+        data = json_loads(response_text)
+        self._write_cache(cache_file, response_text)
+        return data
 
     def get_json_schema(self) -> dict[str, Any]:
         """
         Get the JSON schema for meeting extraction
 
+        Returns:
+            JSON schema dictionary (shared instance, do not mutate)
+        """
+        return self._schema
+
+    @staticmethod
+    def _build_schema() -> dict[str, Any]:
+        """
+        Build the JSON schema for meeting extraction
+
         Returns:
             JSON schema dictionary
         """
@@ -133,272 +824,436 @@ class LLMParser:
         Returns:
             Dictionary with extracted action items, decisions, topics, entities
         """
+        if _is_trivial_note(markdown_content):
+            logger.info(
+                "Skipping LLM parse for near-empty meeting: %s", metadata.get("title", "Untitled")
+            )
+            return _empty_extraction()
+
         try:
-            prompt = self._build_extraction_prompt(markdown_content, metadata)
+            prompt = self._build_extraction_prompt(self._maybe_condense(markdown_content), metadata)
 
-            logger.info(f"Parsing meeting: {metadata.get('title', 'Untitled')}")
-            logger.debug(f"Prompt length: {len(prompt)} chars")
+            logger.info("Parsing meeting: %s", metadata.get("title", "Untitled"))
+            logger.debug("Prompt length: %d chars", len(prompt))
 
             # Call Perplexity API with JSON schema
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                response_format={
-                    "type": "json_schema",
-                    "json_schema": {"name": "meeting_extraction", "schema": self.get_json_schema()},
-                },
-                temperature=0,
+            parsed_data: dict[str, Any] = self._cached_chat_json(
+                prompt, self._response_format, system=_SYSTEM_PROMPT_EXTRACT
             )
-
-            # Extract and parse JSON
-            response_text = response.choices[0].message.content
-            logger.debug(f"Response length: {len(response_text)} chars")
-
-            parsed_data = json.loads(response_text)
+            parsed_data = self._validate_or_repair(parsed_data)
 
             logger.info(
-                f"Successfully parsed meeting: {len(parsed_data.get('action_items', []))} actions, "
-                f"{len(parsed_data.get('decisions', []))} decisions"
+                "Successfully parsed meeting: %d actions, %d decisions",
+                len(parsed_data.get("action_items", [])),
+                len(parsed_data.get("decisions", [])),
             )
 
-            # Stage 2: Consolidate and refine (optional)
-            if len(parsed_data.get("action_items", [])) > 15:
+            # Fallback: consolidate separately if the model ignored the target count,
+            # after merging near-duplicates locally
+            parsed_data["action_items"] = self._dedup_overflow(parsed_data.get("action_items", []))
+            if self._needs_consolidation(parsed_data):
                 logger.info(
-                    f"Stage 2: Consolidating {len(parsed_data['action_items'])} action items..."
+                    "Fallback: Consolidating %d action items...", len(parsed_data["action_items"])
                 )
                 parsed_data = self._consolidate_action_items(
                     parsed_data, markdown_content, metadata
                 )
-                logger.info(f"After consolidation: {len(parsed_data['action_items'])} action items")
+                logger.info(
+                    "After consolidation: %d action items", len(parsed_data["action_items"])
+                )
 
             return parsed_data
 
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON response: {e}")
-            logger.debug(f"Response text: {response_text[:500]}")
+            logger.debug("Response text: %.500s", e.doc)
             raise
         except Exception as e:
             logger.error(f"Error parsing meeting: {e}")
             raise
 
-    def _consolidate_action_items(
-        self, initial_parse: dict[str, Any], markdown_content: str, metadata: dict[str, Any]
+    async def parse_meeting_async(
+        self, markdown_content: str, metadata: dict[str, Any]
     ) -> dict[str, Any]:
         """
-        Stage 2: Consolidate action items with fresh context
-
-        Uses LLM to review extracted actions and consolidate duplicates,
-        remove decision details that shouldn't be actions, and merge related items.
+        Async variant of parse_meeting for processing many meetings concurrently
 
         Args:
-            initial_parse: Initial parsed data with action items
-            markdown_content: Original meeting notes
-            metadata: Meeting metadata
-
+            markdown_content: The meeting notes in markdown format
+            metadata: Meeting metadata (title, date, attendees, etc.)
+
         Returns:
-            Refined parsed data with consolidated action items
+            Dictionary with extracted action items, decisions, topics, entities
         """
-        meeting_title = metadata.get("title", metadata.get("meeting", "Untitled"))
-
-        # Build consolidation prompt
-        actions_json = json.dumps(initial_parse["action_items"], indent=2)
-        decisions_json = json.dumps(initial_parse["decisions"], indent=2)
+        if _is_trivial_note(markdown_content):
+            logger.info(
+                "Skipping LLM parse for near-empty meeting: %s", metadata.get("title", "Untitled")
+            )
+            return _empty_extraction()
 
-        consolidation_prompt = f"""You are reviewing extracted action items from a meeting to consolidate and refine them.
+        condensed = await asyncio.to_thread(self._maybe_condense, markdown_content)
+        prompt = self._build_extraction_prompt(condensed, metadata)
 
-# Meeting: {meeting_title}
+        logger.info("Parsing meeting: %s", metadata.get("title", "Untitled"))
 
-# Extracted Action Items (Initial Pass)
-{actions_json}
+        try:
+            parsed_data: dict[str, Any] = await self._cached_chat_json_async(
+                prompt, self._response_format, system=_SYSTEM_PROMPT_EXTRACT
+            )
+            parsed_data = await self._validate_or_repair_async(parsed_data)
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse JSON response: {e}")
+            logger.debug("Response text: %.500s", e.doc)
+            raise
 
-# Extracted Decisions (for context)
-{decisions_json}
+        logger.info(
+            "Successfully parsed meeting: %d actions, %d decisions",
+            len(parsed_data.get("action_items", [])),
+            len(parsed_data.get("decisions", [])),
+        )
 
-# Task
-Review the action items and consolidate them. Return a refined list that:
+        # Fallback: consolidate separately if the model ignored the target count,
+        # after merging near-duplicates locally
+        parsed_data["action_items"] = self._dedup_overflow(parsed_data.get("action_items", []))
+        if self._needs_consolidation(parsed_data):
+            logger.info(
+                "Fallback: Consolidating %d action items...", len(parsed_data["action_items"])
+            )
+            try:
+                parsed_data["action_items"] = await self._cached_chat_json_async(
+                    self._build_consolidation_prompt(parsed_data, metadata),
+                    system=self._consolidate_system_prompt,
+                )
+            except Exception as e:
+                logger.warning(f"Consolidation failed: {e}. Using original action items.")
+            logger.info("After consolidation: %d action items", len(parsed_data["action_items"]))
 
-1. **Removes duplicates** - If multiple items describe the same work, merge them
-2. **Removes decision details** - If an item is just implementing a decision (like "Change button label X"), either:
-   - Remove it if it's covered by a broader implementation task
-   - Keep it if it's a standalone work item
-3. **Groups related items** - Combine small related tasks into logical work items
-4. **Preserves critical items** - Keep distinct work items that are truly separate
+        return parsed_data
 
-**Examples of consolidation**:
+    def parse_meetings_batch(
+        self,
+        items: list[tuple[str, dict[str, Any]]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list[dict[str, Any] | None]:
+        """
+        Parse several meetings concurrently
 
-Before:
-- "Replace 'car' with 'vehicle' in designs"
-- "Change 'Shop appointment' to 'Shop details'"
-- "Update button label to 'Accept shop referral'"
+        Up to max_concurrency requests are in flight at once over a shared
+        AsyncOpenAI client, so wall time tracks the slowest requests rather than
+        the sum of all of them. A failure on one meeting does not stop the rest of
+        the batch.
 
-After:
-- "Update UI copy and terminology based on design decisions" (combines all copy changes)
+        Args:
+            items: List of (markdown_content, metadata) tuples
+            max_concurrency: Maximum simultaneous Perplexity requests
 
-Before:
-- "Implement MSO shop logic"
-- "Prevent appointment booking for vehicles at shop"
+        Returns:
+            Parsed data for each item in input order, or None where parsing failed
+        """
+        results = asyncio.run(self._parse_meetings_batch_async(items, max_concurrency))
 
-After:
-- "Implement MSO shop logic to prevent appointment booking for vehicles already at shop" (merged related)
+        succeeded = sum(1 for r in results if r is not None)
+        logger.info("Batch complete: %d/%d meetings parsed", succeeded, len(items))
 
-**Guidelines**:
-- Target: 8-15 high-quality action items
-- Each action should be a distinct work item requiring effort
-- Preserve assignees, priorities, and context
-- Don't lose important details - just consolidate redundant ones
+        return results
 
-Return the consolidated action items as a JSON array matching this schema:
-{self.get_json_schema()["properties"]["action_items"]}
+    async def _parse_meetings_batch_async(
+        self, items: list[tuple[str, dict[str, Any]]], max_concurrency: int
+    ) -> list[dict[str, Any] | None]:
+        """Run parse_meeting_async over items with bounded concurrency"""
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
 
-Return ONLY the JSON array, no other text."""
+        async def parse_one(i: int, markdown_content: str, metadata: dict[str, Any]):
+            async with semaphore:
+                logger.info("Batch item %d/%d", i, len(items))
+                try:
+                    return await self.parse_meeting_async(markdown_content, metadata)
+                except Exception as e:
+                    logger.warning(f"Batch item {i} failed: {e}")
+                    return None
 
         try:
-            # Call LLM for consolidation
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": consolidation_prompt}],
-                temperature=0,
+            return await asyncio.gather(
+                *(parse_one(i, md, meta) for i, (md, meta) in enumerate(items, 1))
             )
+        finally:
+            # The client's connection pool is bound to this event loop
+            if self.async_client is not None:
+                await self.async_client.close()
+                self.async_client = None
 
-            consolidated_text = response.choices[0].message.content
-            consolidated_actions = json.loads(consolidated_text)
+    def _schema_error(self, parsed_data: Any) -> str | None:
+        """
+        Validate an extraction response against the JSON schema
 
-            # Replace action items in parsed data
-            initial_parse["action_items"] = consolidated_actions
+        Args:
+            parsed_data: Decoded extraction response
 
-            return initial_parse
+        Returns:
+            Validation error message, or None if valid (or validation unavailable)
+        """
+        if self._validate is None:
+            return None
+        try:
+            self._validate(parsed_data)
+        except fastjsonschema.JsonSchemaException as e:
+            return e.message
+        return None
+
+    def _validate_or_repair(self, parsed_data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Validate an extraction response, asking the model once to repair it if invalid
+
+        Args:
+            parsed_data: Decoded extraction response
 
+        Returns:
+            The valid (or repaired) extraction; the original if the repair fails
+        """
+        if (error := self._schema_error(parsed_data)) is None:
+            return parsed_data
+        logger.warning(f"Response failed schema validation ({error}); requesting repair")
+        try:
+            repaired = self._cached_chat_json(
+                self._build_repair_prompt(parsed_data, error),
+                self._response_format,
+                system=_SYSTEM_PROMPT_EXTRACT,
+            )
         except Exception as e:
-            logger.warning(f"Consolidation failed: {e}. Using original action items.")
-            return initial_parse
+            logger.warning(f"Repair failed: {e}. Using original response.")
+            return parsed_data
+        return self._accept_repair(parsed_data, repaired)
 
-    def _build_extraction_prompt(self, markdown_content: str, metadata: dict[str, Any]) -> str:
+    async def _validate_or_repair_async(self, parsed_data: dict[str, Any]) -> dict[str, Any]:
+        """Async variant of _validate_or_repair"""
+        if (error := self._schema_error(parsed_data)) is None:
+            return parsed_data
+        logger.warning(f"Response failed schema validation ({error}); requesting repair")
+        try:
+            repaired = await self._cached_chat_json_async(
+                self._build_repair_prompt(parsed_data, error),
+                self._response_format,
+                system=_SYSTEM_PROMPT_EXTRACT,
+            )
+        except Exception as e:
+            logger.warning(f"Repair failed: {e}. Using original response.")
+            return parsed_data
+        return self._accept_repair(parsed_data, repaired)
+
+    def _accept_repair(self, original: dict[str, Any], repaired: Any) -> dict[str, Any]:
         """
-        Build the extraction prompt for Perplexity
+        Accept a repaired extraction only if it passes validation
 
         Args:
-            markdown_content: Meeting notes content
-            metadata: Meeting metadata
+            original: Extraction that failed validation
+            repaired: Response to the repair prompt
+
+        Returns:
+            The repaired extraction, or the original if the repair is still invalid
+        """
+        error = self._schema_error(repaired)
+        if error is None:
+            logger.info("Repaired response passed schema validation")
+            return repaired
+        logger.warning(f"Repair still failed schema validation ({error}); using original response")
+        return original
+
+    @staticmethod
+    def _build_repair_prompt(parsed_data: Any, error: str) -> str:
+        """
+        Build a follow-up message asking the model to fix a schema violation
+
+        Args:
+            parsed_data: Extraction that failed validation
+            error: Validation error message
 
         Returns:
             Formatted prompt string
         """
-        meeting_title = metadata.get("title", metadata.get("meeting", "Untitled"))
-        meeting_date = metadata.get("date", "Unknown date")
-        attendees = metadata.get("attendees", [])
-        attendees_str = ", ".join(attendees) if attendees else "Unknown"
+        return f"""# Invalid Extraction
+The JSON below does not match the required schema: {error}
 
-        prompt = f"""You are an expert at analyzing meeting notes and extracting actionable information with exceptional attention to detail.
+{json_dumps_indented(parsed_data)}
 
-# Meeting Context
-- **Title**: {meeting_title}
-- **Date**: {meeting_date}
-- **Attendees**: {attendees_str}
+Return the corrected JSON only, keeping all extracted content that is valid."""
 
-# Meeting Notes
-{markdown_content}
+    def _maybe_condense(self, markdown_content: str) -> str:
+        """
+        Condense very long meeting notes before they are embedded in the prompt
 
----
+        Notes under CONDENSE_THRESHOLD_TOKENS are returned unchanged. Longer notes
+        are split on "## " headings and each section is summarized concurrently
+        with CONDENSE_MODEL; headings are kept so the extractor still sees the
+        meeting structure. Section summaries go through the response cache, so
+        re-running an edited note only re-summarizes the sections that changed.
 
-# Task
-Extract ALL actionable information from these notes. Be THOROUGH - this is production data that people rely on.
+        Args:
+            markdown_content: Meeting notes content
 
-## 1. Action Items - BE SELECTIVE (Quality over Quantity)
+        Returns:
+            Original or condensed markdown
+        """
+        estimated_tokens = len(markdown_content) // CHARS_PER_TOKEN
+        if estimated_tokens <= CONDENSE_THRESHOLD_TOKENS:
+            return markdown_content
+
+        sections: list[str] = []
+        for line in markdown_content.splitlines(keepends=True):
+            if line.startswith("## ") or not sections:
+                sections.append(line)
+            else:
+                sections[-1] += line
+
+        logger.info(
+            "Condensing long meeting notes (~%d tokens, %d sections) with %s",
+            estimated_tokens,
+            len(sections),
+            CONDENSE_MODEL,
+        )
+
+        with ThreadPoolExecutor(max_workers=min(len(sections), DEFAULT_MAX_CONCURRENCY)) as pool:
+            condensed = list(pool.map(self._summarize_section, sections))
+
+        return "\n\n".join(condensed)
+
+    def _summarize_section(self, section: str) -> str:
+        """
+        Summarize one section of meeting notes, keeping its heading
 
-**What counts as an action item** (IMPORTANT - Don't confuse decisions with actions):
+        Args:
+            section: Section text, starting with its "## " heading if it has one
 
-✅ **YES - Extract as action item**:
-- Standalone work that needs to be done: "Update Sidekick to collect phone numbers"
-- Investigation/exploration tasks: "Consider better product naming"
-- Reviews and validations: "Complete QA review"
-- Documentation work: "Create centralized terminology documentation"
-- High-level implementation: "Implement logic for MSO integrated shops"
-- Bug fixes and releases: "Compile must-have bug fixes"
+        Returns:
+            Heading plus summary, or the original section if summarization fails
+        """
+        heading = section.split("\n", 1)[0] if section.startswith("## ") else ""
 
-❌ **NO - This is a DECISION, not an action item**:
-- UI copy changes: "Replace 'car' with 'vehicle'" (this is a decision detail, not a task)
-- Button labels: "Use 'Accept shop referral' button" (design decision)
-- Field requirements: "Make drop-off date mandatory" (requirement decision)
-- Visual changes: "Add car icon to map pin" (design decision)
-- Removal of features: "Remove 'View other recommendations'" (design decision)
+        prompt = _SECTION_SUMMARY_TEMPLATE.format(section=section)
 
-**The distinction**:
-- **Decision** = What we decided to do (goes in Decisions section)
-- **Action item** = Who needs to do work to implement decisions (could be one action for many decisions)
+        try:
+            result = self._cached_chat_json(prompt, _SUMMARY_RESPONSE_FORMAT, model=CONDENSE_MODEL)
+            summary = result["summary"].strip()
+        except Exception as e:
+            logger.warning(f"Section summary failed: {e}. Using original section text.")
+            return section.strip()
 
-**Example**:
-- Meeting discusses: "Use button X", "Change label Y", "Remove field Z"
-- **Decisions**: 3 separate decisions (document what was decided)
-- **Action items**: 1 action item = "Update UI based on design decisions" (the actual work)
+        return f"{heading}\n{summary}" if heading else summary
 
-**Assignee detection** (CRITICAL - don't mark everything "unassigned"):
-- "I'll..." or "I will..." → speaker (check context for who's speaking)
-- "Sam will review" → Sam
-- "[Name] needs to..." → that person
-- "We should..." + specific domain → assign to relevant attendee or "team"
-- Only use "unassigned" if truly impossible to determine
+    def _dedup_overflow(self, actions: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Merge near-duplicate action items locally when there are too many
 
-**Priority assignment**:
-- **high**: Has deadline, blocks work, "must-have", related to imminent release
-- **medium**: Standard tasks, process improvements, no urgency stated
-- **low**: "Consider", "nice to have", exploratory, long-term
+        When the extraction pass overshoots CONSOLIDATION_FALLBACK_THRESHOLD, near-
+        duplicates are merged with _local_dedup so the LLM consolidation fallback
+        is only needed if the count is still over the threshold.
 
-**Context**: Include WHY the task matters, dependencies, blockers
+        Args:
+            actions: Action items from the extraction pass
 
-## 2. Decisions - CAPTURE ALL (not just major ones)
+        Returns:
+            Deduplicated action items, or the input list if within the threshold
+        """
+        if len(actions) <= self.CONSOLIDATION_FALLBACK_THRESHOLD:
+            return actions
 
-Look for:
-- "Use [X] button" (UI decision)
-- "Make [X] mandatory" (requirement decision)
-- "Replace [X] with [Y]" (terminology decision)
-- "Remove [X]" (removal decision)
-- ANY conclusive statement about how to proceed
+        deduped = _local_dedup(actions)
+        if len(deduped) < len(actions):
+            logger.info("Local dedup: %d -> %d action items", len(actions), len(deduped))
+        return deduped
 
-**Rationale**: Explain WHY, not just "for consistency"
-- "Use 'Accept shop referral' for consistency with existing button patterns in the app"
-- Include constraints, requirements, user impact
+    def _needs_consolidation(self, parsed_data: dict[str, Any]) -> bool:
+        """
+        Decide whether the LLM consolidation fallback is needed
 
-**Alternatives**: Look for "instead of", "rather than", "not using", "remove X since Y"
+        Args:
+            parsed_data: Parsed data (after _dedup_overflow)
 
-## 3. Topics - Group logically
-Extract 3-5 major themes and their key points
+        Returns:
+            True if action items should still be consolidated by the LLM
+        """
+        return len(parsed_data.get("action_items", [])) > self.CONSOLIDATION_FALLBACK_THRESHOLD
 
-## 4. Entities - BE EXHAUSTIVE
+    def _consolidate_action_items(
+        self, initial_parse: dict[str, Any], markdown_content: str, metadata: dict[str, Any]
+    ) -> dict[str, Any]:
+        """
+        Fallback: Consolidate action items with fresh context
 
-**People**: ANYONE mentioned, even in passing (beyond attendees)
+        Only used when the extraction pass returns more action items than
+        CONSOLIDATION_FALLBACK_THRESHOLD despite the consolidation guidance in
+        its prompt. Uses LLM to review extracted actions and consolidate duplicates,
+        remove decision details that shouldn't be actions, and merge related items.
 
-**Projects/Products** - Extract ALL:
-- Abbreviations: SAR, NSF, VAS, GPC, MSO, ERAC, FNOL, PEG, etc.
-- Full names: "Service Assignment", "Self-service", etc.
-- Features: "Network shop flow", "Sidekick", "virtual estimate"
+        Args:
+            initial_parse: Initial parsed data with action items
+            markdown_content: Original meeting notes
+            metadata: Meeting metadata
 
-**Companies**: Progressive, Enterprise, Agero, etc.
+        Returns:
+            Refined parsed data with consolidated action items
+        """
+        try:
+            # Call LLM for consolidation
+            consolidated_actions = self._cached_chat_json(
+                self._build_consolidation_prompt(initial_parse, metadata),
+                system=self._consolidate_system_prompt,
+            )
 
-**Technologies/Systems**:
-- "Google API", "Granola API", "Notion"
-- Internal systems: "MSO", "Sidekick"
-- Features: "GPC", "virtual estimate"
+            # Replace action items in parsed data
+            initial_parse["action_items"] = consolidated_actions
 
-**Issues**: ABC-123 patterns (ISA-234, etc.)
+            return initial_parse
 
-## 5. Follow-ups & Open Questions
+        except Exception as e:
+            logger.warning(f"Consolidation failed: {e}. Using original action items.")
+            return initial_parse
 
-**Follow-ups**: Items explicitly needing future discussion
+    def _build_consolidation_prompt(
+        self, initial_parse: dict[str, Any], metadata: dict[str, Any]
+    ) -> str:
+        """
+        Build the per-meeting user message for fallback consolidation
 
-**Open Questions**: Questions with "?" that weren't answered
-- "When a vehicle is at a shop and customer accepts ERAC, how do they receive the rental?"
-- "How does Enterprise coordination work?"
+        The consolidation rules are sent separately as a system prompt.
 
-## Success Criteria (Target for this meeting)
-- ✅ 8-15 action items (actual work items, not decision details!)
-- ✅ 5-15 decisions (include small ones - this is where UI changes go!)
-- ✅ 20-40 entities (be comprehensive!)
-- ✅ Specific assignees where possible (not all "unassigned")
-- ✅ 3-7 open questions
+        Args:
+            initial_parse: Initial parsed data with action items
+            metadata: Meeting metadata
 
-Remember: QUALITY over QUANTITY. Don't duplicate decisions as action items."""
+        Returns:
+            Formatted prompt string
+        """
+        return _CONSOLIDATION_TEMPLATE.format_map(
+            {
+                "meeting_title": metadata.get("title", metadata.get("meeting", "Untitled")),
+                "actions_json": json_dumps_indented(initial_parse["action_items"]),
+                "decisions_json": json_dumps_indented(initial_parse["decisions"]),
+            }
+        )
+
+    def _build_extraction_prompt(self, markdown_content: str, metadata: dict[str, Any]) -> str:
+        """
+        Build the per-meeting user message for extraction
+
+        The extraction instructions are sent separately as _SYSTEM_PROMPT_EXTRACT.
 
-        return prompt
+        Args:
+            markdown_content: Meeting notes content
+            metadata: Meeting metadata
+
+        Returns:
+            Formatted prompt string
+        """
+        attendees = metadata.get("attendees", [])
+
+        return _EXTRACTION_TEMPLATE.format_map(
+            {
+                "meeting_title": metadata.get("title", metadata.get("meeting", "Untitled")),
+                "meeting_date": metadata.get("date", "Unknown date"),
+                "attendees_str": ", ".join(attendees) if attendees else "Unknown",
+                "markdown_content": markdown_content,
+            }
+        )
 
     def enrich_meeting_note(
         self, original_markdown: str, metadata: dict[str, Any], parsed_data: dict[str, Any]
@@ -414,158 +1269,334 @@ Remember: QUALITY over QUANTITY. Don't duplicate decisions as action items."""
         Returns:
             Enhanced markdown with action items, decisions, etc.
         """
-        # Build enhanced note
         sections = []
 
         # Action Items section
         if parsed_data.get("action_items"):
-            sections.append("## Action Items\n")
-            for item in parsed_data["action_items"]:
-                assignee = item.get("assignee", "unassigned")
-                task = item["task"]
-                context = item.get("context", "")
-                due_date = item.get("due_date")
-                priority = item.get("priority", "medium")
-
-                # Format task with Obsidian Tasks plugin emoji format
-                priority_emoji = {"high": "⏫", "medium": "🔽", "low": "⏬"}.get(priority, "")
-
-                due_emoji = f" 📅 {due_date}" if due_date else ""
-
-                sections.append(f"### @{assignee}\n")
-                sections.append(f"- [ ] {task} {priority_emoji}{due_emoji}\n")
-
-                if context:
-                    sections.append(f"  - **Context**: {context}\n")
-                if item.get("mentioned_by"):
-                    sections.append(f"  - **Mentioned by**: {item['mentioned_by']}\n")
-                if item.get("related_entities"):
-                    entities = ", ".join([f"[[{e}]]" for e in item["related_entities"]])
-                    sections.append(f"  - **Related**: {entities}\n")
-
-                sections.append("\n")
+            columns = _action_item_columns(parsed_data["action_items"])
+            sections.append("## Action Items\n" + "".join(map(_format_action_item, *columns)))
 
         # Decisions section
         if parsed_data.get("decisions"):
-            sections.append("## Decisions\n\n")
-            for decision in parsed_data["decisions"]:
-                sections.append(f"### {decision['decision']}\n\n")
-                sections.append(f"**Rationale**: {decision.get('rationale', 'Not specified')}\n\n")
-
-                if decision.get("alternatives_considered"):
-                    sections.append("**Alternatives considered**:\n")
-                    for alt in decision["alternatives_considered"]:
-                        sections.append(f"- {alt}\n")
-                    sections.append("\n")
-
-                if decision.get("impact"):
-                    sections.append(f"**Impact**: {decision['impact']}\n\n")
-                if decision.get("owner"):
-                    sections.append(f"**Owner**: [[{decision['owner']}]]\n\n")
+            sections.append(
+                "## Decisions\n\n" + "".join(map(_format_decision, parsed_data["decisions"]))
+            )
 
         # Topics section (keep original for now, could enhance later)
-        sections.append("## Notes\n\n")
-        sections.append(original_markdown)
+        sections.append(f"## Notes\n\n{original_markdown}")
 
         # Follow-ups section
         if parsed_data.get("follow_ups"):
-            sections.append("\n## Follow-ups\n\n")
-            for item in parsed_data["follow_ups"]:
-                owner = item.get("owner", "unassigned")
-                timing = item.get("timing", "")
-                timing_str = f" ({timing})" if timing else ""
-                sections.append(f"- **@{owner}**: {item['item']}{timing_str}\n")
+            follow_ups = "".join(map(_format_follow_up, parsed_data["follow_ups"]))
+            sections.append(f"\n## Follow-ups\n\n{follow_ups}")
 
         # Open Questions section
         if parsed_data.get("open_questions"):
-            sections.append("\n## Open Questions\n\n")
-            for question in parsed_data["open_questions"]:
-                sections.append(f"- {question}\n")
+            questions = "".join(f"- {question}\n" for question in parsed_data["open_questions"])
+            sections.append(f"\n## Open Questions\n\n{questions}")
 
         # Entities section (as metadata for linking)
         if parsed_data.get("entities"):
-            sections.append("\n## Entities Referenced\n\n")
             entities = parsed_data["entities"]
+            sections.append(
+                "\n## Entities Referenced\n\n"
+                + "".join(
+                    f"**{label}**: {_wikilinks(entities[key])}\n\n"
+                    for key, label in (
+                        ("people", "People"),
+                        ("projects", "Projects"),
+                        ("issues", "Issues"),
+                    )
+                    if entities.get(key)
+                )
+            )
+
+        return "".join(sections)
 
-            if entities.get("people"):
-                people_links = ", ".join([f"[[{p}]]" for p in entities["people"]])
-                sections.append(f"**People**: {people_links}\n\n")
 
-            if entities.get("projects"):
-                project_links = ", ".join([f"[[{p}]]" for p in entities["projects"]])
-                sections.append(f"**Projects**: {project_links}\n\n")
+def _split_frontmatter(content: str) -> tuple[str, str] | None:
+    """
+    Split a note into YAML frontmatter and body with a single linear scan
 
-            if entities.get("issues"):
-                issue_links = ", ".join([f"[[{i}]]" for i in entities["issues"]])
-                sections.append(f"**Issues**: {issue_links}\n\n")
+    Equivalent to matching ^---\\n(.*?)\\n---\\n(.*)$ with DOTALL, without the
+    regex engine.
 
-        return "".join(sections)
+    Args:
+        content: Full note content
+
+    Returns:
+        Tuple of (frontmatter, body), or None if the note has no frontmatter
+    """
+    if not content.startswith("---\n"):
+        return None
+
+    end = content.find("\n---\n", 4)
+    if end == -1:
+        return None
+
+    return content[4:end], content[end + 5 :]
+
+
+def _load_note(file_path: Path) -> tuple[dict[str, Any], str, str | None]:
+    """
+    Split a meeting note into metadata, markdown body and raw frontmatter
+
+    Args:
+        file_path: Path to meeting note markdown file
+
+    Returns:
+        Tuple of (metadata, markdown content, raw frontmatter or None)
+    """
+    import yaml
+
+    # Read bytes in one call and decode once; normalize line endings the way
+    # text-mode open() would so frontmatter splitting sees "\n" only
+    content = file_path.read_bytes().decode("utf-8")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+
+    # Extract metadata from frontmatter
+    split = _split_frontmatter(content)
+
+    if split:
+        frontmatter, markdown_content = split
+        # Prefer the libyaml C loader when PyYAML was built with it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        metadata = yaml.load(frontmatter, Loader=loader)
+        return metadata, markdown_content, frontmatter
+
+    return {"title": file_path.stem}, content, None
+
+
+def _load_batch_note(file_path: Path) -> tuple[dict[str, Any], str, str | None] | None:
+    """
+    Load a note for --batch mode, skipping notes that cannot be parsed
+
+    An undecodable file or malformed frontmatter is logged and skipped rather
+    than aborting the whole batch.
+
+    Args:
+        file_path: Path to meeting note markdown file
+
+    Returns:
+        Tuple of (metadata, markdown content, raw frontmatter or None), or None
+        if the note was skipped
+    """
+    import yaml
+
+    try:
+        note = _load_note(file_path)
+    except (OSError, UnicodeDecodeError, yaml.YAMLError) as e:
+        logger.warning(f"Skipping unreadable note {file_path}: {e}")
+        return None
+
+    if not isinstance(note[0], dict):
+        logger.warning(f"Skipping {file_path}: frontmatter is not a mapping")
+        return None
+
+    return note
+
+
+def _sidecar_path(file_path: Path) -> Path:
+    """Path of the parsed-data cache stored next to a note (foo.md -> foo.md.cache.json)"""
+    return file_path.with_suffix(".md.cache.json")
+
+
+def _sidecar_digest(llm: LLMParser, markdown_content: str, metadata: dict[str, Any]) -> str:
+    """
+    Hash everything that determines a parse result
+
+    Args:
+        llm: Parser (contributes model and schema; prompt texts come from _PROMPTS_DIGEST)
+        markdown_content: Meeting notes body
+        metadata: Meeting metadata
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    key = json.dumps(
+        [
+            _PROMPTS_DIGEST,
+            llm.model,
+            CONDENSE_MODEL,
+            llm.get_json_schema(),
+            metadata,
+            markdown_content,
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def _load_sidecar(file_path: Path, digest: str) -> dict[str, Any] | None:
+    """
+    Load a previous parse result if its digest still matches
+
+    Returns:
+        Parsed data, or None if there is no usable sidecar
+    """
+    if os.getenv("LLM_PARSER_NOCACHE") == "1":
+        return None
+
+    sidecar = _sidecar_path(file_path)
+    try:
+        cached = json_loads(sidecar.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable sidecar {sidecar}: {e}")
+        return None
+
+    if not isinstance(cached, dict) or cached.get("hash") != digest:
+        return None
+    logger.info("Reusing parsed data from %s", sidecar)
+    return cached.get("data")
+
+
+def _save_sidecar(file_path: Path, digest: str, parsed: dict[str, Any]) -> None:
+    """Store a parse result next to its note for idempotent re-runs"""
+    sidecar = _sidecar_path(file_path)
+    try:
+        sidecar.write_text(json_dumps_indented({"hash": digest, "data": parsed}), encoding="utf-8")
+    except OSError as e:
+        logger.warning(f"Failed to write sidecar {sidecar}: {e}")
+
+
+def _write_enriched(
+    llm: LLMParser,
+    file_path: Path,
+    markdown_content: str,
+    metadata: dict[str, Any],
+    parsed: dict[str, Any],
+    frontmatter: str | None,
+) -> Path:
+    """
+    Write the enriched note next to the source file
+
+    Returns:
+        Path to the enriched note
+    """
+    enriched = llm.enrich_meeting_note(markdown_content, metadata, parsed)
+    enriched_path = file_path.parent / f"{file_path.stem}_enriched.md"
+
+    # Reconstruct with frontmatter
+    full_content = f"---\n{frontmatter}\n---\n\n{enriched}" if frontmatter is not None else enriched
+
+    enriched_path.write_text(full_content, encoding="utf-8")
+
+    return enriched_path
 
 
 def main():
     """CLI for testing LLM parser"""
     import argparse
-    import re
-    from pathlib import Path
-
-    import yaml
 
     logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
     parser = argparse.ArgumentParser(description="Parse meeting notes with Perplexity LLM")
-    parser.add_argument(
-        "--file", type=str, required=True, help="Path to meeting note markdown file"
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--file", type=str, help="Path to meeting note markdown file")
+    source.add_argument(
+        "--batch", type=str, metavar="DIR", help="Parse every *.md note in a directory"
     )
     parser.add_argument("--output", type=str, help="Output file for parsed JSON")
     parser.add_argument("--enrich", action="store_true", help="Generate enriched markdown")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        metavar="N",
+        help=f"Concurrent API requests in --batch mode (default: {DEFAULT_MAX_CONCURRENCY})",
+    )
 
     args = parser.parse_args()
 
+    # Batch mode: parse all notes in a directory, writing <stem>_parsed.json next to each
+    if args.batch:
+        batch_dir = Path(args.batch)
+        if not batch_dir.is_dir():
+            print(f"Error: Directory not found: {batch_dir}")
+            return
+
+        candidates = sorted(p for p in batch_dir.glob("*.md") if not p.stem.endswith("_enriched"))
+        # Read and split notes in parallel; disk I/O and YAML parsing overlap
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            loaded = list(pool.map(_load_batch_note, candidates))
+
+        # Notes the processor already enriched carry their LLM output; don't re-parse them
+        paths, notes = [], []
+        for path, note in zip(candidates, loaded, strict=True):
+            if note is None:
+                continue
+            if note[0].get("llm_enriched"):
+                print(f"- Already enriched, skipping: {path}")
+                continue
+            paths.append(path)
+            notes.append(note)
+
+        llm = LLMParser()
+
+        # Only notes whose sidecar is missing or stale go to the API
+        digests = [_sidecar_digest(llm, md, meta) for meta, md, _ in notes]
+        results = [_load_sidecar(path, digest) for path, digest in zip(paths, digests, strict=True)]
+        pending = [i for i, parsed in enumerate(results) if parsed is None]
+        if pending:
+            fresh = llm.parse_meetings_batch(
+                [(notes[i][1], notes[i][0]) for i in pending], max_concurrency=args.concurrency
+            )
+            for i, parsed in zip(pending, fresh, strict=True):
+                results[i] = parsed
+                if parsed is not None:
+                    _save_sidecar(paths[i], digests[i], parsed)
+
+        for path, (metadata, markdown_content, frontmatter), parsed in zip(
+            paths, notes, results, strict=True
+        ):
+            if parsed is None:
+                print(f"✗ Failed to parse: {path}")
+                continue
+
+            output_path = path.parent / f"{path.stem}_parsed.json"
+            output_path.write_text(json_dumps_indented(parsed), encoding="utf-8")
+            print(f"✓ Parsed data written to: {output_path}")
+
+            if args.enrich:
+                enriched_path = _write_enriched(
+                    llm, path, markdown_content, metadata, parsed, frontmatter
+                )
+                print(f"✓ Enriched note written to: {enriched_path}")
+        return
+
     # Read file
     file_path = Path(args.file)
     if not file_path.exists():
         print(f"Error: File not found: {file_path}")
         return
 
-    with open(file_path, encoding="utf-8") as f:
-        content = f.read()
+    metadata, markdown_content, frontmatter = _load_note(file_path)
 
-    # Extract metadata from frontmatter
-    frontmatter_match = re.match(r"^---\n(.*?)\n---\n(.*)$", content, re.DOTALL)
-
-    if frontmatter_match:
-        metadata = yaml.safe_load(frontmatter_match.group(1))
-        markdown_content = frontmatter_match.group(2)
-    else:
-        metadata = {"title": file_path.stem}
-        markdown_content = content
-
-    # Parse with LLM
+    # Parse with LLM, reusing the sidecar result if inputs are unchanged
     llm = LLMParser()
-    parsed = llm.parse_meeting(markdown_content, metadata)
+    digest = _sidecar_digest(llm, markdown_content, metadata)
+    parsed = _load_sidecar(file_path, digest)
+    if parsed is None:
+        parsed = llm.parse_meeting(markdown_content, metadata)
+        _save_sidecar(file_path, digest, parsed)
 
     # Output
     if args.output:
         with open(args.output, "w", encoding="utf-8") as f:
-            json.dump(parsed, f, indent=2)
+            f.write(json_dumps_indented(parsed))
         print(f"✓ Parsed data written to: {args.output}")
     else:
-        print(json.dumps(parsed, indent=2))
+        print(json_dumps_indented(parsed))
 
     # Generate enriched note
     if args.enrich:
-        enriched = llm.enrich_meeting_note(markdown_content, metadata, parsed)
-        enriched_path = file_path.parent / f"{file_path.stem}_enriched.md"
-
-        # Reconstruct with frontmatter
-        if frontmatter_match:
-            full_content = f"---\n{frontmatter_match.group(1)}\n---\n\n{enriched}"
-        else:
-            full_content = enriched
-
-        with open(enriched_path, "w", encoding="utf-8") as f:
-            f.write(full_content)
-
+        enriched_path = _write_enriched(
+            llm, file_path, markdown_content, metadata, parsed, frontmatter
+        )
         print(f"✓ Enriched note written to: {enriched_path}")
 
 
@@ -4,9 +4,12 @@ Obsidian Writer
 Write meeting notes to Obsidian vault with YAML frontmatter and markdown content.
 """
 
+import functools
 import logging
+import os
 import re
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
@@ -17,6 +20,64 @@ from format_converter import MetadataExtractor, ProseMirrorConverter
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; used for every note / attendee
+_INVALID_FILENAME_CHARS = str.maketrans("", "", '<>:"/\\|?*!')
+_WHITESPACE_RUN = re.compile(r"\s+")
+_NAME_WITH_EMAIL = re.compile(r"(.+?)\s*<.*>")
+
+# Prefer the libyaml C emitter when PyYAML was built with it
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """
+    Write a file so readers (e.g. Obsidian sync) never see it half-written
+
+    Writes a hidden temp file in the same directory, then renames it into place.
+
+    Args:
+        path: Destination path
+        data: Complete file content
+    """
+    tmp = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_bytes(data)
+        tmp.replace(path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_iso_timestamp(timestamp: str) -> datetime | None:
+    """Parse an ISO 8601 timestamp (accepting a trailing "Z"), or None if invalid"""
+    try:
+        return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _format_datetime(dt: datetime) -> tuple[str, str, str]:
+    """
+    Format a meeting datetime for the note, once per distinct local wall time
+
+    Aware datetimes for the same instant compare equal across offsets, so the
+    cache is keyed on the UTC offset as well as the datetime.
+
+    Args:
+        dt: Meeting datetime
+
+    Returns:
+        Tuple of (YYYY-MM-DD date, HH:MM time, long header form)
+    """
+    return _format_datetime_cached(dt, dt.utcoffset())
+
+
+@functools.lru_cache(maxsize=512)
+def _format_datetime_cached(dt: datetime, utcoffset: timedelta | None) -> tuple[str, str, str]:
+    """Format dt as (date, time, long header form); utcoffset is only part of the cache key"""
+    return dt.strftime("%Y-%m-%d"), dt.strftime("%H:%M"), dt.strftime("%A, %B %d, %Y at %I:%M %p")
+
 
 class ObsidianWriter:
     """Write meeting notes to Obsidian vault"""
@@ -36,50 +97,177 @@ class ObsidianWriter:
         # Create inbox directory if it doesn't exist
         self.inbox_path.mkdir(parents=True, exist_ok=True)
 
+        # One reusable converter per thread (convert() resets its own state but
+        # keeps it on the instance, so an instance must not be shared by threads)
+        self._local = threading.local()
+
+        # (exception type, message) pairs whose traceback has been logged; batch
+        # callers reset this per run with reset_failure_log
+        self._logged_failures: set[tuple[str, str]] = set()
+        self._failure_lock = threading.Lock()
+
         logger.info(f"ObsidianWriter initialized (vault: {self.vault_path})")
 
-    def write_meeting_note(self, doc: dict[str, Any]) -> Path | None:
+    def write_meeting_note(
+        self, doc: dict[str, Any], generated_at: str | None = None
+    ) -> Path | None:
         """
         Write a meeting note to the vault
 
         Args:
             doc: Granola document dictionary
+            generated_at: ISO timestamp for the "Generated" footer (defaults to now)
 
         Returns:
             Path to created note, or None if failed
         """
+        note = self.build_note(doc, generated_at)
+        if note is None:
+            return None
+
+        filepath, frontmatter, body = note
+        return self.flush_note(filepath, self.render_note(frontmatter, body))
+
+    def build_note(
+        self, doc: dict[str, Any], generated_at: str | None = None
+    ) -> tuple[Path, dict[str, Any], str] | None:
+        """
+        Build a meeting note in memory without writing it
+
+        Callers that post-process the note (e.g. LLM enrichment) can do so on
+        the returned parts and write the final content once with flush_note.
+
+        Args:
+            doc: Granola document dictionary
+            generated_at: ISO timestamp for the "Generated" footer (defaults to now);
+                batch callers pass one value per run
+
+        Returns:
+            Tuple of (target path, frontmatter dict, note body), or None if failed
+        """
         try:
-            # Extract metadata
+            # Extract metadata; parse created_at once for filename, frontmatter and header
             metadata = MetadataExtractor.extract_metadata(doc)
+            metadata["_created_dt"] = self._parse_created_at(metadata.get("created_at"))
 
             # Convert content to markdown
-            converter = ProseMirrorConverter()
             if "content" in metadata and metadata["content"]:
-                markdown_content = converter.convert(metadata["content"])
+                markdown_content = self._converter.convert(metadata["content"])
             else:
-                logger.warning(f"No content found for document {metadata['granola_id']}")
+                logger.warning("No content found for document %s", metadata["granola_id"])
                 markdown_content = "_No content available_"
 
             # Generate filename
             filename = self._generate_filename(metadata)
 
-            # Generate full note with frontmatter
-            note_content = self._generate_note(metadata, markdown_content)
+            return (
+                self.inbox_path / filename,
+                self._build_frontmatter_fields(metadata),
+                self._generate_body(metadata, markdown_content, generated_at),
+            )
+
+        except Exception as e:
+            self._log_failure(e)
+            return None
+
+    def reset_failure_log(self) -> None:
+        """Forget logged failures so the next occurrence of each logs its traceback again"""
+        with self._failure_lock:
+            self._logged_failures.clear()
+
+    def _log_failure(self, e: Exception) -> None:
+        """
+        Log a failed note build or write
+
+        A systemic failure (e.g. a full disk) fails every note the same way, so the
+        traceback is logged only for the first occurrence of each distinct error;
+        repeats get the one-line error only.
+
+        Args:
+            e: The exception raised while building or writing the note
+        """
+        logger.error(f"Error writing meeting note: {e}")
+
+        key = (type(e).__name__, str(e)[:120])
+        with self._failure_lock:
+            first = key not in self._logged_failures
+            self._logged_failures.add(key)
+        if first:
+            logger.error("Detailed error:", exc_info=e)
+
+    @property
+    def _converter(self) -> ProseMirrorConverter:
+        """ProseMirrorConverter for the current thread, created on first use"""
+        converter = getattr(self._local, "converter", None)
+        if converter is None:
+            converter = self._local.converter = ProseMirrorConverter()
+        return converter
+
+    def render_note(self, frontmatter: dict[str, Any], body: str) -> str:
+        """
+        Combine frontmatter and body into the note file content
+
+        Args:
+            frontmatter: Frontmatter fields
+            body: Note body (as returned by build_note)
 
-            # Write to file
-            filepath: Path = self.inbox_path / filename
+        Returns:
+            Complete note content
+        """
+        return f"---\n{self._dump_frontmatter(frontmatter)}---\n{body}"
 
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write(note_content)
+    def flush_note(self, filepath: Path, note_content: str) -> Path | None:
+        """
+        Write final note content to disk in a single open/write/close
 
-            logger.info(f"Created meeting note: {filename}")
+        Args:
+            filepath: Target path in the vault
+            note_content: Complete note content
+
+        Returns:
+            Path to created note, or None if failed
+        """
+        try:
+            _atomic_write(filepath, note_content.encode("utf-8"))
+
+            logger.info("Created meeting note: %s", filepath.name)
             return filepath
 
         except Exception as e:
-            logger.error(f"Error writing meeting note: {e}")
-            logger.exception("Detailed error:")
+            self._log_failure(e)
             return None
 
+    def sync_notes(self, paths: list[Path]) -> None:
+        """
+        Make written notes durable in one pass at the end of a run
+
+        Notes are not fsynced as they are written; this flushes each file and
+        then the inbox directory (so the renames are persisted) once per batch.
+
+        Args:
+            paths: Notes written during the run
+        """
+        for path in paths:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+            except OSError as e:
+                logger.warning("Failed to sync %s: %s", path, e)
+
+        if paths:
+            try:
+                dir_fd = os.open(self.inbox_path, os.O_RDONLY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+            except OSError as e:
+                # Directory fsync is unsupported on some platforms (e.g. Windows)
+                logger.debug("Directory sync skipped for %s: %s", self.inbox_path, e)
+
     def _generate_filename(self, metadata: dict[str, Any]) -> str:
         """
         Generate filename for meeting note
@@ -92,16 +280,9 @@ class ObsidianWriter:
         Returns:
             Filename string
         """
-        # Parse created_at timestamp
-        created_at = metadata.get("created_at")
-        if created_at:
-            try:
-                dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                date_str = dt.strftime("%Y-%m-%d")
-            except (ValueError, AttributeError):
-                date_str = datetime.now().strftime("%Y-%m-%d")
-        else:
-            date_str = datetime.now().strftime("%Y-%m-%d")
+        # Date from created_at timestamp (today if missing or invalid)
+        dt = self._created_datetime(metadata) or datetime.now()
+        date_str = _format_datetime(dt)[0]
 
         # Sanitize title for filename
         title = metadata.get("title", "Untitled Meeting")
@@ -109,6 +290,37 @@ class ObsidianWriter:
 
         return f"{date_str} - {safe_title}.md"
 
+    @staticmethod
+    def _parse_created_at(created_at: Any) -> datetime | None:
+        """
+        Parse a Granola created_at timestamp
+
+        Args:
+            created_at: ISO 8601 timestamp (may end in "Z")
+
+        Returns:
+            Parsed datetime, or None if missing or invalid
+        """
+        if not created_at or not isinstance(created_at, str):
+            return None
+        return _parse_iso_timestamp(created_at)
+
+    def _created_datetime(self, metadata: dict[str, Any]) -> datetime | None:
+        """
+        Get the meeting's created_at as a datetime
+
+        Uses the value parsed once by build_note when present.
+
+        Args:
+            metadata: Meeting metadata
+
+        Returns:
+            Parsed datetime, or None if missing or invalid
+        """
+        if "_created_dt" in metadata:
+            return metadata["_created_dt"]
+        return self._parse_created_at(metadata.get("created_at"))
+
     def _sanitize_filename(self, filename: str) -> str:
         """
         Sanitize string for use in filename
@@ -119,16 +331,8 @@ class ObsidianWriter:
         Returns:
             Safe filename
         """
-        # Remove or replace invalid characters
-        safe = re.sub(r'[<>:"/\\|?*!]', "", filename)
-
-        # Replace multiple spaces with single space
-        safe = re.sub(r"\s+", " ", safe)
-
-        # Trim and limit length
-        safe = safe.strip()[:100]
-
-        return safe
+        # Drop invalid characters, collapse whitespace runs, then trim and limit length
+        return _WHITESPACE_RUN.sub(" ", filename.translate(_INVALID_FILENAME_CHARS)).strip()[:100]
 
     def _generate_note(self, metadata: dict[str, Any], markdown_content: str) -> str:
         """
@@ -141,17 +345,31 @@ class ObsidianWriter:
         Returns:
             Complete note content
         """
-        # Build frontmatter
-        frontmatter = self._build_frontmatter(metadata)
+        return self.render_note(
+            self._build_frontmatter_fields(metadata),
+            self._generate_body(metadata, markdown_content),
+        )
+
+    def _generate_body(
+        self, metadata: dict[str, Any], markdown_content: str, generated_at: str | None = None
+    ) -> str:
+        """
+        Generate the note body that follows the frontmatter
 
+        Args:
+            metadata: Meeting metadata
+            markdown_content: Converted markdown content
+            generated_at: ISO timestamp for the footer (defaults to now)
+
+        Returns:
+            Note body (title, header, notes and footer)
+        """
         # Build note sections
         title = metadata.get("title", "Untitled Meeting")
         header = self._build_header(metadata)
+        generated_at = generated_at or datetime.now().isoformat()
 
-        # Combine into full note
-        note = f"""---
-{frontmatter}---
-
+        return f"""
 # {title}
 
 {header}
@@ -162,13 +380,11 @@ class ObsidianWriter:
 
 ---
 
-**Generated**: {datetime.now().isoformat()} via Task Centralization System
+**Generated**: {generated_at} via Task Centralization System
 **Source**: Granola API (automatic capture)
 **Granola ID**: `{metadata.get("granola_id")}`
 """
 
-        return note
-
     def _build_frontmatter(self, metadata: dict[str, Any]) -> str:
         """
         Build YAML frontmatter
@@ -179,19 +395,48 @@ class ObsidianWriter:
         Returns:
             YAML frontmatter string
         """
-        # Parse date/time
-        created_at = metadata.get("created_at")
-        if created_at:
-            try:
-                dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                date = dt.strftime("%Y-%m-%d")
-                time = dt.strftime("%H:%M")
-            except (ValueError, AttributeError):
-                date = datetime.now().strftime("%Y-%m-%d")
-                time = datetime.now().strftime("%H:%M")
-        else:
-            date = datetime.now().strftime("%Y-%m-%d")
-            time = datetime.now().strftime("%H:%M")
+        return self._dump_frontmatter(self._build_frontmatter_fields(metadata))
+
+    def _dump_frontmatter(self, fm: dict[str, Any]) -> str:
+        """
+        Serialize frontmatter fields to YAML
+
+        Args:
+            fm: Frontmatter fields
+
+        Returns:
+            YAML frontmatter string
+        """
+        yaml_str = yaml.dump(
+            fm, Dumper=_YAML_DUMPER, default_flow_style=False, allow_unicode=True, sort_keys=False
+        )
+
+        # libyaml escapes non-BMP characters (e.g. emoji in titles); re-dump with the
+        # pure-Python emitter so they stay literal
+        if "\\U" in yaml_str:
+            yaml_str = yaml.dump(
+                fm,
+                Dumper=yaml.SafeDumper,
+                default_flow_style=False,
+                allow_unicode=True,
+                sort_keys=False,
+            )
+
+        return yaml_str
+
+    def _build_frontmatter_fields(self, metadata: dict[str, Any]) -> dict[str, Any]:
+        """
+        Build frontmatter fields
+
+        Args:
+            metadata: Meeting metadata
+
+        Returns:
+            Frontmatter dict (in output order)
+        """
+        # Date/time from created_at (now if missing or invalid)
+        dt = self._created_datetime(metadata) or datetime.now()
+        date, time, _ = _format_datetime(dt)
 
         # Build frontmatter dict
         fm = {
@@ -207,7 +452,7 @@ class ObsidianWriter:
         # Add attendees as wikilinks
         attendees = metadata.get("attendees", [])
         if attendees:
-            fm["attendees"] = [f"[[{self._extract_name(email)}]]" for email in attendees]
+            fm["attendees"] = list(map(self._wikilink_for, attendees))
 
         # Add optional fields if available
         if metadata.get("duration_minutes"):
@@ -219,15 +464,29 @@ class ObsidianWriter:
         if metadata.get("calendar_event_id"):
             fm["calendar_event_id"] = metadata["calendar_event_id"]
 
-        # Convert to YAML
-        yaml_str = yaml.dump(fm, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        return fm
 
-        return yaml_str
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _wikilink_for(email_or_name: str) -> str:
+        """
+        Build the [[Name]] wikilink for an attendee (cached across notes)
 
-    def _extract_name(self, email_or_name: str) -> str:
+        Args:
+            email_or_name: Email address or name string.
+
+        Returns:
+            Wikilink to the person's note.
+        """
+        return f"[[{ObsidianWriter._extract_name(email_or_name)}]]"
+
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _extract_name(email_or_name: str) -> str:
         """
         Extract person name from email or name string.
         Handles "Full Name <email@example.com>" format.
+        Pure over its input, so results are cached for recurring attendees.
 
         Args:
             email_or_name: Email address or name string.
@@ -235,14 +494,15 @@ class ObsidianWriter:
         Returns:
             Person name suitable for a note title.
         """
-        # Check for "Name <email>" format
-        match = re.match(r"(.+?)\s*<.*>", email_or_name)
-        if match:
-            return match.group(1).strip()
+        # Check for "Name <email>" format (skip the regex when there is no "<")
+        if "<" in email_or_name:
+            match = _NAME_WITH_EMAIL.match(email_or_name)
+            if match:
+                return match.group(1).strip()
 
         # If it's just an email, extract the name part
         if "@" in email_or_name:
-            name_part = email_or_name.split("@")[0]
+            name_part = email_or_name.split("@", 1)[0]
 
             # Convert common patterns to readable names
             # e.g., "john.doe" -> "John Doe"
@@ -266,21 +526,14 @@ class ObsidianWriter:
         Returns:
             Header markdown string
         """
-        # Parse date/time
-        created_at = metadata.get("created_at")
-        if created_at:
-            try:
-                dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                date_formatted = dt.strftime("%A, %B %d, %Y at %I:%M %p")
-            except (ValueError, AttributeError):
-                date_formatted = "Date unknown"
-        else:
-            date_formatted = "Date unknown"
+        # Date/time from created_at
+        dt = self._created_datetime(metadata)
+        date_formatted = _format_datetime(dt)[2] if dt else "Date unknown"
 
         # Build attendee list
         attendees = metadata.get("attendees", [])
         if attendees:
-            attendee_links = ", ".join([f"[[{self._extract_name(email)}]]" for email in attendees])
+            attendee_links = ", ".join(map(self._wikilink_for, attendees))
         else:
             attendee_links = "_No attendees recorded_"
 
@@ -288,19 +541,19 @@ class ObsidianWriter:
         duration = metadata.get("duration_minutes")
         duration_str = f"{duration} minutes" if duration else "Duration unknown"
 
-        header = f"**{date_formatted}** · {duration_str}  \n**Attendees**: {attendee_links}"
+        parts = [f"**{date_formatted}** · {duration_str}  \n**Attendees**: {attendee_links}"]
 
         # Add recording link if available
         recording_url = metadata.get("recording_url")
         meeting_link = metadata.get("meeting_link")
 
         if recording_url:
-            header += f"\n\n🎥 [Recording]({recording_url})"
+            parts.append(f"\n\n🎥 [Recording]({recording_url})")
 
         if meeting_link:
-            header += f" · 📅 [Calendar Event]({meeting_link})"
+            parts.append(f" · 📅 [Calendar Event]({meeting_link})")
 
-        return header
+        return "".join(parts)
 
 
 if __name__ == "__main__":
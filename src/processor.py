@@ -5,28 +5,62 @@ Main orchestrator that fetches Granola documents and writes them to Obsidian.
 """
 
 import logging
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import yaml
+
 from credential_manager import CredentialManager
 from granola_fetcher import GranolaFetcher
 from obsidian_writer import ObsidianWriter
 from sync_state import SyncStateManager
 
+try:
+    from llm_parser_perplexity import LLMParser
+except ImportError:
+    LLMParser = None  # type: ignore[assignment,misc]
+
 logger = logging.getLogger(__name__)
 
+# libyaml C emitter when available (identical output for ASCII-escaped dumps)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# A note written this run: (path, frontmatter fields, body, rendered "---" frontmatter block)
+_WrittenNote = tuple[Path, dict[str, Any], str, str]
+
 
 class GranolaProcessor:
     """Main processor for Granola → Obsidian pipeline"""
 
-    def __init__(self, enable_llm: bool = True):
+    # Processed IDs are written to the state file every this many IDs (and at the end
+    # of a run), bypassing SyncStateManager's time-based write coalescing so a crash
+    # loses at most one partial batch
+    STATE_FLUSH_INTERVAL = 25
+
+    # Maximum in-flight LLM requests when enriching a run's notes
+    LLM_CONCURRENCY = 8
+
+    # Notes per enrichment batch; batches are enriched in the background as notes are written
+    LLM_BATCH_SIZE = 16
+
+    # Worker threads building and writing notes
+    WRITE_WORKERS = 8
+
+    def __init__(self, enable_llm: bool = True, max_workers: int | None = None):
         """
         Initialize processor
 
         Args:
             enable_llm: Enable LLM-based action item extraction (default: True)
+            max_workers: Worker threads building and writing notes
+                (default: WRITE_WORKERS)
         """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        self.max_workers = max_workers or self.WRITE_WORKERS
         self.cred_manager = CredentialManager()
         self.fetcher = GranolaFetcher(self.cred_manager)
         self.writer = ObsidianWriter(self.cred_manager)
@@ -34,10 +68,12 @@ class GranolaProcessor:
 
         # Initialize LLM parser if enabled
         self.llm_parser = None
-        if enable_llm:
+        if enable_llm and LLMParser is None:
+            logger.warning(
+                "LLM parser dependencies not installed. Continuing without LLM enrichment."
+            )
+        elif enable_llm:
             try:
-                from llm_parser_perplexity import LLMParser
-
                 # Get LLM config from credentials
                 llm_config = self.cred_manager.get_llm_config()
                 if llm_config:
@@ -58,10 +94,16 @@ class GranolaProcessor:
         else:
             logger.info("GranolaProcessor initialized (LLM enrichment disabled)")
 
-    def process_new_meetings(self) -> dict[str, Any]:
+    def process_new_meetings(
+        self, on_result: Callable[[dict[str, Any]], None] | None = None
+    ) -> dict[str, Any]:
         """
         Fetch new meetings and process them
 
+        Args:
+            on_result: Called with {"id", "note"} or {"id", "error"} as each
+                document finishes, for streaming progress
+
         Returns:
             Dictionary with processing results
         """
@@ -77,6 +119,12 @@ class GranolaProcessor:
             "errors": [],
         }
 
+        processed_ids: list[str] = []
+
+        # Enrichment runs on a background thread, one batch at a time, so LLM
+        # latency overlaps the remaining note writes
+        enricher = ThreadPoolExecutor(max_workers=1) if self.llm_parser else None
+
         try:
             # Fetch new documents
             logger.info("Fetching new documents from Granola API...")
@@ -88,74 +136,168 @@ class GranolaProcessor:
                 return results
 
             results["fetched"] = len(documents)
-            logger.info(f"Fetched {len(documents)} new documents")
+            logger.info("Fetched %d new documents", len(documents))
 
             if len(documents) == 0:
                 logger.info("No new documents to process")
                 return results
 
-            # Process each document
-            for i, doc in enumerate(documents, 1):
+            # Drop already-processed and invalid documents before any per-doc work
+            pending = self._pending_documents(documents, require_valid_meeting=True)
+            results["skipped"] = len(documents) - len(pending)
+
+            # Write every note unenriched (fast local I/O), so notes show up in
+            # Obsidian without waiting on the LLM; each full batch of written notes
+            # is handed to the enricher while writing continues
+            batch: list[_WrittenNote] = []
+            for doc, (note, error) in self._write_documents(pending, results["timestamp"]):
                 doc_id = doc.get("id", "unknown")
-                title = doc.get("title", "Untitled")
-
-                logger.info(f"Processing document {i}/{len(documents)}: {title}")
-
-                try:
-                    # Check if already processed
-                    if self.state.is_processed(doc_id):
-                        logger.info("  → Already processed, skipping")
-                        results["skipped"] += 1
-                        continue
-
-                    # Check if document is valid meeting
-                    if not doc.get("valid_meeting", True):
-                        logger.info(f"  Skipping invalid meeting: {doc_id}")
-                        results["skipped"] += 1
-                        continue
-
-                    # Write to Obsidian
-                    filepath = self.writer.write_meeting_note(doc)
-
-                    if filepath:
-                        results["processed"] += 1
-                        results["notes_created"].append(str(filepath))
-                        logger.info(f"  ✓ Created: {filepath.name}")
-
-                        # Mark as processed
-                        self.state.mark_processed(doc_id)
-
-                        # Enrich with LLM if enabled
-                        if self.llm_parser:
-                            try:
-                                self._enrich_note_with_llm(filepath)
-                                logger.info("  ✓ Enriched with LLM parsing")
-                            except Exception as e:
-                                logger.warning(f"  ⚠ LLM enrichment failed: {e}")
-                                # Don't fail the whole process if LLM enrichment fails
-                    else:
-                        results["failed"] += 1
-                        results["errors"].append(f"Failed to write note for {doc_id}")
-                        logger.error(f"  ✗ Failed to create note for {doc_id}")
-
-                except Exception as e:
+
+                if note:
+                    filepath = note[0]
+                    results["processed"] += 1
+                    results["notes_created"].append(str(filepath))
+                    logger.info("  ✓ Created: %s", filepath.name)
+                    if on_result:
+                        on_result({"id": doc_id, "note": str(filepath)})
+
+                    # Mark as processed (persisted in batches)
+                    processed_ids.append(doc_id)
+                    if len(processed_ids) >= self.STATE_FLUSH_INTERVAL:
+                        self._flush_processed(processed_ids)
+
+                    if enricher:
+                        batch.append(note)
+                        if len(batch) >= self.LLM_BATCH_SIZE:
+                            enricher.submit(self._enrich_batch, batch)
+                            batch = []
+                else:
                     results["failed"] += 1
-                    error_msg = f"Error processing {doc_id}: {str(e)}"
-                    results["errors"].append(error_msg)
-                    logger.error(f"  ✗ {error_msg}")
-                    logger.exception("Detailed error:")
+                    results["errors"].append(error)
+                    logger.error("  ✗ %s", error)
+                    if on_result:
+                        on_result({"id": doc_id, "error": error})
+
+            if enricher and batch:
+                enricher.submit(self._enrich_batch, batch)
 
             logger.info(
-                f"Processing complete: {results['processed']} notes created, {results['failed']} failed"
+                "Processing complete: %d notes created, %d failed",
+                results["processed"],
+                results["failed"],
             )
 
         except Exception as e:
-            logger.error(f"Fatal error during processing: {e}")
+            logger.error("Fatal error during processing: %s", e)
             logger.exception("Detailed error:")
             results["errors"].append(f"Fatal error: {str(e)}")
+        finally:
+            # Let queued enrichment batches finish before notes are synced
+            if enricher:
+                enricher.shutdown(wait=True)
+
+            # Notes are made durable once per run rather than per write
+            self.writer.sync_notes([Path(p) for p in results["notes_created"]])
+            self._flush_processed(processed_ids)
 
         return results
 
+    def _write_documents(
+        self, documents: list[dict[str, Any]], generated_at: str
+    ) -> Iterator[tuple[dict[str, Any], tuple[_WrittenNote | None, str | None]]]:
+        """
+        Build and write notes concurrently
+
+        Conversion and disk writes for up to max_workers documents overlap;
+        outcomes are yielded in input order so the caller can reduce results and
+        sync state on its own thread without locking.
+
+        Args:
+            documents: Documents to write
+            generated_at: Run timestamp for the notes' "Generated" footer
+
+        Yields:
+            (document, (note or None, error or None)) as returned by _write_document
+        """
+        # Each distinct note failure gets one traceback per run
+        self.writer.reset_failure_log()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            outcomes = pool.map(lambda doc: self._write_document(doc, generated_at), documents)
+            yield from zip(documents, outcomes, strict=True)
+
+    def _write_document(
+        self, doc: dict[str, Any], generated_at: str
+    ) -> tuple[_WrittenNote | None, str | None]:
+        """
+        Build and write a single meeting note (without LLM enrichment)
+
+        Args:
+            doc: Granola document dictionary
+            generated_at: Run timestamp for the note's "Generated" footer
+
+        Returns:
+            Tuple of ((path, frontmatter, body, frontmatter block) or None,
+            error message or None)
+        """
+        doc_id = doc.get("id", "unknown")
+        logger.info("Processing document: %s", doc.get("title", "Untitled"))
+
+        try:
+            note = self.writer.build_note(doc, generated_at)
+            if not note:
+                return None, f"Failed to write note for {doc_id}"
+
+            # The rendered frontmatter block is kept so enrichment can extend it as-is
+            filepath, frontmatter, body = note
+            header = self.writer.render_note(frontmatter, "")
+            if not self.writer.flush_note(filepath, header + body):
+                return None, f"Failed to write note for {doc_id}"
+            return (filepath, frontmatter, body, header), None
+
+        except Exception as e:
+            # Shares the writer's per-run dedupe, so repeats skip the traceback
+            self.writer._log_failure(e)
+            return None, f"Error processing {doc_id}: {str(e)}"
+
+    def _enrich_batch(self, batch: list[_WrittenNote]) -> None:
+        """
+        Enrich a batch of written notes with LLM-extracted data
+
+        The batch is parsed via LLMParser.parse_meetings_batch (up to
+        LLM_CONCURRENCY requests in flight) and each note is rewritten in place.
+        Failures are logged and leave the unenriched note as written.
+
+        Args:
+            batch: Notes written this run, up to LLM_BATCH_SIZE of them
+        """
+        logger.info("Enriching %d notes with LLM parsing...", len(batch))
+
+        try:
+            parsed_batch = self.llm_parser.parse_meetings_batch(
+                [(body, frontmatter) for _, frontmatter, body, _ in batch],
+                max_concurrency=self.LLM_CONCURRENCY,
+            )
+        except Exception as e:
+            logger.warning("  ⚠ LLM enrichment failed for %d notes: %s", len(batch), e)
+            return
+
+        for (filepath, frontmatter, body, header), parsed_data in zip(
+            batch, parsed_batch, strict=True
+        ):
+            if parsed_data is None:
+                logger.warning("  ⚠ LLM enrichment failed for %s", filepath.name)
+                continue
+
+            try:
+                note_content = self._render_enriched_note(header, frontmatter, body, parsed_data)
+            except Exception as e:
+                logger.warning("  ⚠ LLM enrichment failed for %s: %s", filepath.name, e)
+                continue
+
+            if self.writer.flush_note(filepath, note_content):
+                logger.info("  ✓ Enriched with LLM parsing: %s", filepath.name)
+
     def process_specific_document(self, doc_id: str) -> bool:
         """
         Process a specific Granola document by ID
@@ -190,12 +332,16 @@ class GranolaProcessor:
             logger.exception("Detailed error:")
             return False
 
-    def process_backfill(self, days: int = 7) -> dict[str, Any]:
+    def process_backfill(
+        self, days: int = 7, on_result: Callable[[dict[str, Any]], None] | None = None
+    ) -> dict[str, Any]:
         """
         Process all documents from the last N days
 
         Args:
             days: Number of days to backfill
+            on_result: Called with {"id", "note"} or {"id", "error"} as each
+                document finishes, for streaming progress
 
         Returns:
             Dictionary with processing results
@@ -213,6 +359,8 @@ class GranolaProcessor:
             "errors": [],
         }
 
+        processed_ids: list[str] = []
+
         try:
             # Fetch all documents (no date filter)
             logger.info("Fetching recent documents...")
@@ -224,102 +372,132 @@ class GranolaProcessor:
                 return results
 
             results["fetched"] = len(documents)
-            logger.info(f"Fetched {len(documents)} documents")
-
-            # Process each document
-            for i, doc in enumerate(documents, 1):
-                doc_id = doc.get("id", "unknown")
-                title = doc.get("title", "Untitled")
+            logger.info("Fetched %d documents", len(documents))
 
-                logger.info(f"Processing {i}/{len(documents)}: {title}")
+            # Drop already-processed documents before any per-doc work
+            pending = self._pending_documents(documents)
+            results["skipped"] = len(documents) - len(pending)
 
-                try:
-                    # Check if already processed
-                    if self.state.is_processed(doc_id):
-                        logger.info("  → Already processed, skipping")
-                        results["skipped"] += 1
-                        continue
-
-                    # Write to Obsidian
-                    filepath = self.writer.write_meeting_note(doc)
-
-                    if filepath:
-                        results["processed"] += 1
-                        results["notes_created"].append(str(filepath))
-                        logger.info(f"  ✓ Created: {filepath.name}")
-
-                        # Mark as processed
-                        self.state.mark_processed(doc_id)
-                    else:
-                        results["failed"] += 1
-                        logger.error("  ✗ Failed to create note")
+            # Build and write notes on worker threads; results are reduced here
+            for doc, (note, error) in self._write_documents(pending, results["timestamp"]):
+                doc_id = doc.get("id", "unknown")
 
-                except Exception as e:
+                if note:
+                    filepath = note[0]
+                    results["processed"] += 1
+                    results["notes_created"].append(str(filepath))
+                    logger.info("  ✓ Created: %s", filepath.name)
+                    if on_result:
+                        on_result({"id": doc_id, "note": str(filepath)})
+
+                    # Mark as processed (persisted in batches)
+                    processed_ids.append(doc_id)
+                    if len(processed_ids) >= self.STATE_FLUSH_INTERVAL:
+                        self._flush_processed(processed_ids)
+                else:
                     results["failed"] += 1
-                    error_msg = f"Error processing {doc_id}: {str(e)}"
-                    results["errors"].append(error_msg)
-                    logger.error(f"  ✗ {error_msg}")
+                    results["errors"].append(error)
+                    logger.error("  ✗ %s", error)
+                    if on_result:
+                        on_result({"id": doc_id, "error": error})
 
-            logger.info(f"Backfill complete: {results['processed']} notes created")
+            logger.info("Backfill complete: %d notes created", results["processed"])
 
         except Exception as e:
-            logger.error(f"Fatal error during backfill: {e}")
+            logger.error("Fatal error during backfill: %s", e)
             logger.exception("Detailed error:")
             results["errors"].append(f"Fatal error: {str(e)}")
+        finally:
+            # Notes are made durable once per run rather than per write
+            self.writer.sync_notes([Path(p) for p in results["notes_created"]])
+            self._flush_processed(processed_ids)
 
         return results
 
-    def _enrich_note_with_llm(self, filepath: Path) -> None:
+    def _pending_documents(
+        self, documents: list[dict[str, Any]], require_valid_meeting: bool = False
+    ) -> list[dict[str, Any]]:
         """
-        Enrich a meeting note with LLM-extracted action items and decisions
+        Filter out documents that need no processing
 
-        Args:
-            filepath: Path to the meeting note to enrich
-        """
-        import re
-
-        import yaml
-
-        # Read the file
-        with open(filepath, encoding="utf-8") as f:
-            content = f.read()
+        Uses a single set-membership check per document against the in-memory
+        processed IDs; repeated IDs within the batch are kept once.
 
-        # Extract frontmatter and content
-        frontmatter_match = re.match(r"^---\n(.*?)\n---\n(.*)$", content, re.DOTALL)
+        Args:
+            documents: Fetched Granola documents
+            require_valid_meeting: Also drop documents flagged valid_meeting=False
 
-        if not frontmatter_match:
-            logger.warning(f"No frontmatter found in {filepath}, skipping LLM enrichment")
-            return
+        Returns:
+            Documents still to process, in fetch order
+        """
+        processed = self.state.processed_ids_set()
+        seen: set[str] = set()
+        pending = []
+
+        for doc in documents:
+            doc_id = doc.get("id", "unknown")
+            if doc_id in processed or doc_id in seen:
+                continue
+            if require_valid_meeting and not doc.get("valid_meeting", True):
+                continue
+            seen.add(doc_id)
+            pending.append(doc)
+
+        if len(pending) < len(documents):
+            logger.info(
+                "Skipping %d already processed or invalid documents", len(documents) - len(pending)
+            )
+        return pending
 
-        frontmatter_yaml = frontmatter_match.group(1)
-        markdown_content = frontmatter_match.group(2)
+    def _flush_processed(self, processed_ids: list[str]) -> None:
+        """
+        Persist buffered processed IDs in a single state write
 
-        # Parse frontmatter
-        metadata = yaml.safe_load(frontmatter_yaml)
+        The write happens immediately rather than at SyncStateManager's next
+        coalesced save, so committed IDs survive a crash.
 
-        # Check if LLM parser is available
-        if not self.llm_parser:
-            logger.warning("LLM parser not available, skipping enrichment")
-            return
+        Args:
+            processed_ids: Buffered document IDs (cleared after flushing)
+        """
+        if processed_ids:
+            self.state.mark_batch_processed(processed_ids)
+            self.state.flush()
+            processed_ids.clear()
+
+    def _render_enriched_note(
+        self,
+        header: str,
+        metadata: dict[str, Any],
+        markdown_content: str,
+        parsed_data: dict[str, Any],
+    ) -> str:
+        """
+        Render a meeting note enriched with LLM-extracted action items and decisions
 
-        # Parse with LLM
-        parsed_data = self.llm_parser.parse_meeting(markdown_content, metadata)
+        Args:
+            header: Frontmatter block ("---" delimited) the note was written with
+            metadata: Note frontmatter fields
+            markdown_content: Note body following the frontmatter
+            parsed_data: LLM parse result for the note
 
+        Returns:
+            Complete enriched note content (frontmatter and body)
+        """
         # Generate enriched content
         enriched_content = self.llm_parser.enrich_meeting_note(
             markdown_content, metadata, parsed_data
         )
 
-        # Update metadata to indicate LLM enrichment
-        metadata["llm_enriched"] = True
-        metadata["llm_model"] = f"perplexity-{self.llm_parser.model}"
-
-        # Write enriched note back
-        enriched_frontmatter = yaml.dump(metadata, default_flow_style=False, sort_keys=False)
-        full_content = f"---\n{enriched_frontmatter}---\n\n{enriched_content}"
-
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(full_content)
+        # Splice the enrichment markers onto the frontmatter as written rather than
+        # re-dumping it, so the fields the note already had are left byte-for-byte
+        markers = yaml.dump(
+            {"llm_enriched": True, "llm_model": f"perplexity-{self.llm_parser.model}"},
+            Dumper=_YAML_DUMPER,
+            default_flow_style=False,
+            sort_keys=False,
+        )
+        frontmatter = header.removesuffix("---\n")
+        return f"{frontmatter}{markers}---\n\n{enriched_content}"
 
 
 def main():
@@ -334,18 +512,41 @@ def main():
         handlers=[logging.FileHandler("logs/processor.log"), logging.StreamHandler()],
     )
 
+    def positive_int(value: str) -> int:
+        """argparse type for counts that must be at least 1"""
+        number = int(value)
+        if number < 1:
+            raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+        return number
+
     # Parse arguments
     parser = argparse.ArgumentParser(description="Process Granola meetings to Obsidian")
     parser.add_argument(
         "--backfill", type=int, metavar="DAYS", help="Backfill last N days of meetings"
     )
     parser.add_argument("--doc-id", type=str, metavar="ID", help="Process specific document by ID")
-    parser.add_argument("--json", action="store_true", help="Output results as JSON")
+    parser.add_argument(
+        "--json", action="store_true", help="Output results as JSON Lines (one per document)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=positive_int,
+        default=GranolaProcessor.WRITE_WORKERS,
+        metavar="N",
+        help=f"Threads building and writing notes (default: {GranolaProcessor.WRITE_WORKERS})",
+    )
+    parser.add_argument("--no-llm", action="store_true", help="Skip LLM enrichment")
 
     args = parser.parse_args()
 
     # Initialize processor
-    processor = GranolaProcessor()
+    processor = GranolaProcessor(enable_llm=not args.no_llm, max_workers=args.workers)
+
+    # With --json, runs stream one JSON line per document and end with the summary line
+    def emit(item: dict[str, Any]) -> None:
+        print(json.dumps(item), flush=True)
+
+    on_result = emit if args.json else None
 
     # Execute requested action
     if args.doc_id:
@@ -360,9 +561,9 @@ def main():
 
     elif args.backfill:
         # Backfill mode
-        results = processor.process_backfill(days=args.backfill)
+        results = processor.process_backfill(days=args.backfill, on_result=on_result)
         if args.json:
-            print(json.dumps(results, indent=2))
+            emit(results)
         else:
             print("\n=== Backfill Results ===")
             print(f"Fetched: {results['fetched']}")
@@ -376,9 +577,9 @@ def main():
 
     else:
         # Default: process new meetings
-        results = processor.process_new_meetings()
+        results = processor.process_new_meetings(on_result=on_result)
         if args.json:
-            print(json.dumps(results, indent=2))
+            emit(results)
         else:
             print("\n=== Processing Results ===")
             print(f"Fetched: {results['fetched']}")
@@ -13,14 +13,21 @@ Monitors Slack messages via Chrome DevTools Protocol and extracts task-creating
 Writes task captures to Obsidian daily notes.
 """
 
+import difflib
 import json
 import logging
+import re
 import sys
+import threading
 import time
-from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 from pathlib import Path
 from typing import Any
 
+from sync_state import SyncStateManager
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -29,6 +36,233 @@ except ImportError:
     logger.error("pychrome not installed. Install with: pip install pychrome")
     sys.exit(1)
 
+# Longest sleep between checks while the view stays quiet (seconds)
+MAX_POLL_INTERVAL = 600
+
+# Shortest sleep between checks right after new messages (seconds)
+MIN_POLL_INTERVAL = 5
+
+# Persisted IDs of messages already handled, so a restart does not re-extract them
+SEEN_STATE_FILE = Path("logs/.slack_seen.json")
+
+# Seen IDs older than this are pruned; IDs carry the day they were seen, so only
+# the current day's are needed to filter repeats
+SEEN_RETENTION_DAYS = 2
+
+# With the similar-batch cache on, a batch whose message text has at least this
+# SequenceMatcher ratio to a recent one reuses that batch's extracted tasks
+SIMILAR_BATCH_RATIO = 0.92
+
+# Recent extractions kept in memory for the similar-batch lookup
+SIMILAR_BATCH_WINDOW = 256
+
+# Message extraction script injected into the Slack page; compiled once per page
+# load via Runtime.compileScript and re-run by scriptId on each check
+_EXTRACT_MESSAGES_JS = """
+(() => {
+    // Find the message pane
+    const messagePane = document.querySelector('.p-message_pane') ||
+                       document.querySelector('.c-message_list');
+
+    if (!messagePane) {
+        return { error: 'Message pane not found' };
+    }
+
+    // No alternation or case-insensitive flag; matches exactly what /(AM|PM)?/i did
+    const timePattern = /\\d{1,2}:\\d{2}\\s*(?:[AaPp][Mm])?/;
+    const messages = [];
+    const seen = new Set();
+
+    // Only id/author/timestamp/content go back over CDP; duplicates
+    // (by the first 100 chars of text) are dropped as they are found
+    const addMessage = (text, timestamp) => {
+        const key = text.substring(0, 100);
+        if (seen.has(key)) return;
+        seen.add(key);
+
+        const message = { timestamp: timestamp };
+
+        // Try to find author (usually before timestamp)
+        const lines = text.split('\\n');
+        if (lines.length > 1) {
+            message.author = lines[0];
+            message.content = lines.slice(2).join('\\n');
+        }
+
+        // Create unique ID (author + timestamp + first 50 chars)
+        message.id = (message.author || 'unknown') + '-' +
+                    (message.timestamp || 'no-time') + '-' +
+                    text.substring(0, 50).replace(/[^a-zA-Z0-9]/g, '');
+
+        messages.push(message);
+    };
+
+    // Found a timestamp, walk up to find message container. Both paths use
+    // this walk, so a message gets the same id whichever path finds it
+    const addFromTimestamp = (el) => {
+        const text = el.innerText || '';
+        // Cheap length and ':' checks skip most elements before any regex work
+        if (text.length >= 100 || !text.includes(':') || !timePattern.test(text)) return;
+
+        let parent = el.parentElement;
+        for (let i = 0; i < 5 && parent; i++) {
+            const parentText = parent.innerText || '';
+
+            // Message container heuristics:
+            // - Has reasonable text length
+            // - Contains timestamp
+            // - Not too large (not the whole list)
+            if (parentText.length > 20 &&
+                parentText.length < 2000 &&
+                timePattern.test(parentText)) {
+                addMessage(parentText, text.match(timePattern)?.[0]);
+                return;
+            }
+            parent = parent.parentElement;
+        }
+    };
+
+    // Fast path: only walk from elements inside Slack's own message containers
+    const containers = messagePane.querySelectorAll(
+        '[data-qa="message_container"], .c-message_kit__background'
+    );
+    for (const container of containers) {
+        addFromTimestamp(container);
+        for (const el of container.querySelectorAll('*')) addFromTimestamp(el);
+    }
+
+    if (messages.length > 0) {
+        return { found: messages.length, messages: messages };
+    }
+
+    // Fallback: find all elements with timestamps (indicates messages)
+    for (const el of messagePane.querySelectorAll('*')) addFromTimestamp(el);
+
+    return {
+        found: messages.length,
+        messages: messages
+    };
+})()
+"""
+
+# Static task-extraction instructions, sent as the system prompt ahead of the
+# messages so the provider can reuse the cached prefix across calls
+_SYSTEM_PROMPT_EXTRACT_TASKS = """You are analyzing Slack messages to extract action items and tasks.
+
+# Task
+Extract any action items, tasks, or work that needs to be done from these messages.
+
+For each task, extract:
+- **task**: Clear description of what needs to be done
+- **assignee**: Who should do it (person mentioned, or "unassigned")
+- **context**: Why it matters, any constraints or dependencies
+- **priority**: high, medium, or low
+- **source_author**: Who created/mentioned this task
+- **channel**: If mentioned (otherwise "unknown")
+
+**Guidelines**:
+- Only extract if there's actual work to be done
+- Questions that need answers are tasks
+- Requests for help are tasks
+- "Can you..." / "Could you..." / "Please..." are tasks
+- Ignore casual conversation, greetings, status updates
+- If someone volunteers ("I'll do X"), that's a task for them
+
+Return a JSON object with a "tasks" array. If no tasks found, return: {"tasks": []}
+
+Each task should match this structure:
+{
+  "task": "string",
+  "assignee": "string",
+  "context": "string",
+  "priority": "high" | "medium" | "low",
+  "source_author": "string",
+  "channel": "string"
+}"""
+
+# Structured output for task extraction, so the reply is always bare JSON
+_TASKS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "slack_tasks",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "tasks": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "task": {"type": "string"},
+                            "assignee": {"type": "string"},
+                            "context": {"type": "string"},
+                            "priority": {"type": "string", "enum": ["high", "medium", "low"]},
+                            "source_author": {"type": "string"},
+                            "channel": {"type": "string"},
+                        },
+                        "required": ["task"],
+                    },
+                }
+            },
+            "required": ["tasks"],
+        },
+    },
+}
+
+# Extraction requests per batch; replies that fail to decode are sent back with
+# the error for the model to correct
+EXTRACT_ATTEMPTS = 3
+
+# Quick heuristic filter for task-creating messages (save LLM calls); one
+# case-insensitive alternation scans each message once
+_TASK_INDICATORS = re.compile(
+    "|".join(
+        map(
+            re.escape,
+            [
+                "can you",
+                "could you",
+                "please",
+                "need to",
+                "todo",
+                "action item",
+                "@",  # Mentions often indicate assignments
+                "?",  # Questions often become tasks
+                "should",
+                "must",
+                "blocked",
+                "help",
+            ],
+        )
+    ),
+    re.IGNORECASE,
+)
+
+
+def _next_poll_interval(check_interval: int, empty_streak: int, found_new: bool) -> tuple[int, int]:
+    """
+    Compute the sleep before the next check
+
+    After new messages the monitor re-checks at a quarter of check_interval (at
+    least MIN_POLL_INTERVAL). Each consecutive empty check doubles the sleep from
+    check_interval up to MAX_POLL_INTERVAL, or check_interval if that is larger.
+
+    Args:
+        check_interval: Configured base interval (seconds)
+        empty_streak: Consecutive empty checks before this one
+        found_new: Whether this check found new messages
+
+    Returns:
+        Tuple of (sleep seconds, updated empty streak)
+    """
+    if found_new:
+        return max(check_interval // 4, MIN_POLL_INTERVAL), 0
+
+    max_sleep = max(MAX_POLL_INTERVAL, check_interval)
+    sleep_s = min(check_interval * 2**empty_streak, max_sleep)
+    # Stop growing the streak once capped so 2**empty_streak stays small
+    return sleep_s, empty_streak + 1 if sleep_s < max_sleep else empty_streak
+
 
 class SlackCDPMonitor:
     """Monitor Slack messages via CDP and extract tasks"""
@@ -39,6 +273,7 @@ class SlackCDPMonitor:
         enable_llm: bool = True,
         cdp_port: int = 9222,
         check_interval: int = 60,
+        similar_cache: bool = False,
     ):
         """
         Initialize Slack CDP monitor
@@ -48,16 +283,30 @@ class SlackCDPMonitor:
             enable_llm: Enable LLM-based task extraction (default: True)
             cdp_port: Chrome DevTools Protocol port (default: 9222)
             check_interval: Seconds between message checks (default: 60)
+            similar_cache: Reuse extractions for near-duplicate message batches
         """
         self.vault_path = Path(vault_path)
         self.cdp_port = cdp_port
         self.check_interval = check_interval
+
+        # (lower-cased message text, extracted tasks) for recent batches
+        self._recent_extractions: deque[tuple[str, list[dict[str, Any]]]] | None = (
+            deque(maxlen=SIMILAR_BATCH_WINDOW) if similar_cache else None
+        )
         self.browser: Any | None = None
         self.tab: Any | None = None
+        self._script_id: str | None = None
 
         # State tracking
         self.last_check_time = datetime.now()
-        self.seen_message_ids: set[str] = set()
+        self.seen_state = SyncStateManager(SEEN_STATE_FILE)
+        self.seen_message_ids = self.seen_state.processed_ids_set()
+
+        # IDs handed to the capture worker but not yet captured; the lock guards
+        # these and seen_state, which the worker updates
+        self._pending_ids: set[str] = set()
+        self._seen_lock = threading.Lock()
+        self._pruned_on: date | None = None
 
         # Initialize LLM parser if enabled
         self.llm_parser = None
@@ -114,6 +363,7 @@ class SlackCDPMonitor:
 
             self.tab = tabs[0]
             self.tab.start()
+            self._script_id = None
 
             logger.info(f"✅ Connected to Slack (Tab ID: {self.tab.id})")
             return True
@@ -148,86 +398,7 @@ class SlackCDPMonitor:
         assert self.tab is not None
 
         try:
-            # Type annotation for extracted messages
-            result = self.tab.Runtime.evaluate(
-                expression="""
-                (() => {
-                    const messages = [];
-
-                    // Find the message pane
-                    const messagePane = document.querySelector('.p-message_pane') ||
-                                       document.querySelector('.c-message_list');
-
-                    if (!messagePane) {
-                        return { error: 'Message pane not found' };
-                    }
-
-                    // Find all elements with timestamps (indicates messages)
-                    const timePattern = /\\d{1,2}:\\d{2}\\s*(AM|PM)?/i;
-                    const allElements = messagePane.querySelectorAll('*');
-
-                    const messageContainers = new Set();
-
-                    allElements.forEach(el => {
-                        const text = el.innerText || '';
-                        if (timePattern.test(text) && text.length < 100) {
-                            // Found a timestamp, walk up to find message container
-                            let parent = el.parentElement;
-                            for (let i = 0; i < 5 && parent; i++) {
-                                const parentText = parent.innerText || '';
-
-                                // Message container heuristics:
-                                // - Has reasonable text length
-                                // - Contains timestamp
-                                // - Not too large (not the whole list)
-                                if (parentText.length > 20 &&
-                                    parentText.length < 2000 &&
-                                    timePattern.test(parentText)) {
-
-                                    // Try to extract message components
-                                    const message = {
-                                        fullText: parentText,
-                                        timestamp: text.match(timePattern)?.[0],
-                                        classes: parent.className,
-                                    };
-
-                                    // Try to find author (usually before timestamp)
-                                    const lines = parentText.split('\\n');
-                                    if (lines.length > 1) {
-                                        message.author = lines[0];
-                                        message.content = lines.slice(2).join('\\n');
-                                    }
-
-                                    // Create unique ID (author + timestamp + first 50 chars)
-                                    message.id = (message.author || 'unknown') + '-' +
-                                                (message.timestamp || 'no-time') + '-' +
-                                                parentText.substring(0, 50).replace(/[^a-zA-Z0-9]/g, '');
-
-                                    messages.push(message);
-                                    break;
-                                }
-                                parent = parent.parentElement;
-                            }
-                        }
-                    });
-
-                    // Deduplicate by full text
-                    const seen = new Set();
-                    const unique = messages.filter(msg => {
-                        const key = msg.fullText.substring(0, 100);
-                        if (seen.has(key)) return false;
-                        seen.add(key);
-                        return true;
-                    });
-
-                    return {
-                        found: unique.length,
-                        messages: unique
-                    };
-                })()
-                """,
-                returnByValue=True,
-            )
+            result = self._run_extract_script()
 
             data = result.get("result", {}).get("value", {})
 
@@ -244,24 +415,61 @@ class SlackCDPMonitor:
             logger.error(f"Error extracting messages: {e}")
             return []
 
+    def _run_extract_script(self) -> dict[str, Any]:
+        """
+        Run the message extraction script in the Slack tab
+
+        The script is compiled on first use and then re-run by scriptId, so its
+        source is sent and parsed once rather than on every check. A page reload
+        drops compiled scripts; the script is then compiled again and re-run.
+
+        Returns:
+            Runtime.runScript response
+        """
+        if self._script_id is not None:
+            try:
+                return self.tab.Runtime.runScript(scriptId=self._script_id, returnByValue=True)
+            except pychrome.CallMethodException:
+                logger.debug("Compiled extraction script is gone; compiling again")
+
+        compiled = self.tab.Runtime.compileScript(
+            expression=_EXTRACT_MESSAGES_JS, sourceURL="slack_extract.js", persistScript=True
+        )
+        self._script_id = compiled["scriptId"]
+        return self.tab.Runtime.runScript(scriptId=self._script_id, returnByValue=True)
+
     def filter_new_messages(self, messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """
-        Filter out messages we've already seen
+        Filter out messages we've already seen or are still capturing
+
+        Message IDs are prefixed with today's date, since Slack only shows the
+        time of day; the same text at the same time on a later day is a new
+        message. New messages stay pending until mark_seen() or release_pending().
+        Seen IDs are persisted in SEEN_STATE_FILE, so they survive restarts.
 
         Args:
             messages: List of extracted messages
 
         Returns:
-            List of new messages only
+            List of new messages only, with dated IDs
         """
+        today = date.today()
         new_messages = []
 
-        for msg in messages:
-            msg_id = msg.get("id", "")
+        with self._seen_lock:
+            if self._pruned_on != today:
+                self.seen_state.prune_old_ids(SEEN_RETENTION_DAYS)
+                self._pruned_on = today
+
+            for msg in messages:
+                if not msg.get("id"):
+                    continue
 
-            if msg_id and msg_id not in self.seen_message_ids:
-                new_messages.append(msg)
-                self.seen_message_ids.add(msg_id)
+                msg_id = f"{today.isoformat()}-{msg['id']}"
+                if msg_id not in self.seen_message_ids and msg_id not in self._pending_ids:
+                    msg["id"] = msg_id
+                    new_messages.append(msg)
+                    self._pending_ids.add(msg_id)
 
         logger.info(
             f"Found {len(new_messages)} new messages (filtered {len(messages) - len(new_messages)})"
@@ -269,6 +477,35 @@ class SlackCDPMonitor:
 
         return new_messages
 
+    def mark_seen(self, messages: list[dict[str, Any]], flush: bool = False):
+        """
+        Record pending messages as handled so later checks skip them
+
+        Args:
+            messages: Messages returned by filter_new_messages
+            flush: Write the seen state now instead of at its next coalesced save
+        """
+        if not messages:
+            return
+
+        ids = [msg["id"] for msg in messages]
+        with self._seen_lock:
+            self._pending_ids.difference_update(ids)
+            # One state write per batch rather than per message
+            self.seen_state.mark_batch_processed(ids)
+            if flush:
+                self.seen_state.flush()
+
+    def release_pending(self, messages: list[dict[str, Any]]):
+        """
+        Return pending messages to the unseen pool so the next check retries them
+
+        Args:
+            messages: Messages returned by filter_new_messages
+        """
+        with self._seen_lock:
+            self._pending_ids.difference_update(msg["id"] for msg in messages)
+
     def detect_task_creating_messages(self, messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """
         Detect which messages likely contain tasks
@@ -288,22 +525,7 @@ class SlackCDPMonitor:
             content = msg.get("content", "")
 
             # Quick heuristic filter first (save LLM calls)
-            task_indicators = [
-                "can you",
-                "could you",
-                "please",
-                "need to",
-                "todo",
-                "action item",
-                "@",  # Mentions often indicate assignments
-                "?",  # Questions often become tasks
-                "should",
-                "must",
-                "blocked",
-                "help",
-            ]
-
-            if any(indicator in content.lower() for indicator in task_indicators):
+            if _TASK_INDICATORS.search(content):
                 msg["likely_task"] = True
                 task_messages.append(msg)
             else:
@@ -328,6 +550,25 @@ class SlackCDPMonitor:
         if not self.llm_parser or not messages:
             return []
 
+        try:
+            return self._extract_tasks(messages)
+        except Exception as e:
+            logger.error(f"Error extracting tasks with LLM: {e}")
+            return []
+
+    def _extract_tasks(self, messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Extract structured tasks from messages, raising if extraction fails
+
+        Args:
+            messages: List of messages
+
+        Returns:
+            List of extracted tasks
+
+        Raises:
+            Exception: If the LLM request fails or every reply is invalid
+        """
         # Combine messages into a single context for LLM
         combined_messages = "\n\n".join(
             [
@@ -336,72 +577,105 @@ class SlackCDPMonitor:
             ]
         )
 
-        # Build extraction prompt
-        prompt = f"""You are analyzing Slack messages to extract action items and tasks.
+        # Only the messages vary per call; the instructions are a fixed system prompt
+        prompt = f"# Slack Messages\n{combined_messages}"
 
-# Slack Messages
-{combined_messages}
+        # Reworded repeats of a recent batch reuse its tasks instead of a new LLM call
+        similarity_text = "\n".join(msg.get("content", "") for msg in messages).lower()
+        similar = self._similar_extraction(similarity_text)
+        if similar is not None:
+            logger.info("Using extraction from a similar batch: %d tasks", len(similar))
+            return similar
 
----
+        chat = [
+            {"role": "system", "content": _SYSTEM_PROMPT_EXTRACT_TASKS},
+            {"role": "user", "content": prompt},
+        ]
 
-# Task
-Extract any action items, tasks, or work that needs to be done from these messages.
-
-For each task, extract:
-- **task**: Clear description of what needs to be done
-- **assignee**: Who should do it (person mentioned, or "unassigned")
-- **context**: Why it matters, any constraints or dependencies
-- **priority**: high, medium, or low
-- **source_author**: Who created/mentioned this task
-- **channel**: If mentioned (otherwise "unknown")
-
-**Guidelines**:
-- Only extract if there's actual work to be done
-- Questions that need answers are tasks
-- Requests for help are tasks
-- "Can you..." / "Could you..." / "Please..." are tasks
-- Ignore casual conversation, greetings, status updates
-- If someone volunteers ("I'll do X"), that's a task for them
-
-Return a JSON array of tasks. If no tasks found, return empty array: []
-
-Each task should match this structure:
-{{
-  "task": "string",
-  "assignee": "string",
-  "context": "string",
-  "priority": "high" | "medium" | "low",
-  "source_author": "string",
-  "channel": "string"
-}}"""
-
-        try:
-            logger.info("Extracting tasks from messages using LLM...")
+        logger.info("Extracting tasks from messages using LLM...")
 
+        for attempt in range(1, EXTRACT_ATTEMPTS + 1):
             response = self.llm_parser.client.chat.completions.create(
                 model=self.llm_parser.model,
-                messages=[{"role": "user", "content": prompt}],
+                messages=chat,
                 temperature=0,
+                response_format=_TASKS_RESPONSE_FORMAT,
             )
-
             response_text = response.choices[0].message.content
 
-            # Try to extract JSON from response
-            # Sometimes LLM wraps in markdown code blocks
-            if "```json" in response_text:
-                response_text = response_text.split("```json")[1].split("```")[0]
-            elif "```" in response_text:
-                response_text = response_text.split("```")[1].split("```")[0]
+            try:
+                extracted_tasks = self._decode_tasks(response_text)
+                break
+            except ValueError as e:
+                if attempt == EXTRACT_ATTEMPTS:
+                    raise
+                logger.warning(
+                    "Invalid task extraction (attempt %d/%d): %s", attempt, EXTRACT_ATTEMPTS, e
+                )
+                chat += [
+                    {"role": "assistant", "content": response_text},
+                    {
+                        "role": "user",
+                        "content": f"Your output was invalid: {e}. "
+                        "Return only the corrected JSON object.",
+                    },
+                ]
+
+        logger.info(f"Extracted {len(extracted_tasks)} tasks from {len(messages)} messages")
+
+        if self._recent_extractions is not None:
+            self._recent_extractions.append((similarity_text, extracted_tasks))
+        return extracted_tasks
+
+    @staticmethod
+    def _decode_tasks(response_text: str) -> list[dict[str, Any]]:
+        """
+        Decode and check a task-extraction reply
+
+        Args:
+            response_text: Raw model output
 
-            extracted_tasks: list[dict[str, Any]] = json.loads(response_text.strip())
+        Returns:
+            Extracted tasks
 
-            logger.info(f"Extracted {len(extracted_tasks)} tasks from {len(messages)} messages")
+        Raises:
+            ValueError: If the reply is not a {"tasks": [...]} object whose items
+                each have a "task" string (json.JSONDecodeError is a ValueError)
+        """
+        data = json.loads(response_text)
+        tasks = data.get("tasks") if isinstance(data, dict) else None
+        if not isinstance(tasks, list):
+            raise ValueError('expected an object with a "tasks" array')
+        for item in tasks:
+            if not isinstance(item, dict) or not isinstance(item.get("task"), str):
+                raise ValueError(f'task without a "task" string: {item!r}')
+        return tasks
+
+    def _similar_extraction(self, text: str) -> list[dict[str, Any]] | None:
+        """
+        Find the tasks of a recent batch whose message text nearly matches
 
-            return extracted_tasks
+        Args:
+            text: Lower-cased message contents of the current batch
 
-        except Exception as e:
-            logger.error(f"Error extracting tasks with LLM: {e}")
-            return []
+        Returns:
+            Tasks of the most recent batch with a ratio of at least
+            SIMILAR_BATCH_RATIO, or None if there is none (or the lookup is off)
+        """
+        if not self._recent_extractions:
+            return None
+
+        # seq2 is cached by SequenceMatcher, so it holds the current batch
+        matcher = difflib.SequenceMatcher(None, b=text)
+        for recent_text, tasks in reversed(self._recent_extractions):
+            matcher.set_seq1(recent_text)
+            if (
+                matcher.real_quick_ratio() >= SIMILAR_BATCH_RATIO
+                and matcher.quick_ratio() >= SIMILAR_BATCH_RATIO
+                and matcher.ratio() >= SIMILAR_BATCH_RATIO
+            ):
+                return tasks
+        return None
 
     def write_tasks_to_obsidian(self, tasks: list[dict[str, Any]]):
         """
@@ -426,13 +700,11 @@ Each task should match this structure:
         # Ensure directory exists
         daily_note_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Read existing content or create new
-        if daily_note_path.exists():
-            with open(daily_note_path, encoding="utf-8") as f:
-                existing_content = f.read()
-        else:
-            # Create new daily note
-            existing_content = f"""---
+        # Start a new daily note with its header; existing notes only get the new
+        # section appended, so a capture costs the same however long the note is
+        parts: list[str] = []
+        if not daily_note_path.exists():
+            parts.append(f"""---
 date: {today.strftime("%Y-%m-%d")}
 type: slack-capture
 tags: [slack, tasks, automated]
@@ -440,10 +712,10 @@ tags: [slack, tasks, automated]
 
 # Slack Task Captures - {today.strftime("%Y-%m-%d")}
 
-"""
+""")
 
         # Append new tasks
-        task_section = f"\n## Captured at {datetime.now().strftime('%H:%M:%S')}\n\n"
+        parts.append(f"\n## Captured at {datetime.now().strftime('%H:%M:%S')}\n\n")
 
         for task in tasks:
             assignee = task.get("assignee", "unassigned")
@@ -456,23 +728,20 @@ tags: [slack, tasks, automated]
             # Format task with Obsidian Tasks plugin emoji format
             priority_emoji = {"high": "⏫", "medium": "🔽", "low": "⏬"}.get(priority, "")
 
-            task_section += f"### @{assignee}\n\n"
-            task_section += f"- [ ] {task_text} {priority_emoji}\n"
+            parts.append(f"### @{assignee}\n\n")
+            parts.append(f"- [ ] {task_text} {priority_emoji}\n")
 
             if context:
-                task_section += f"  - **Context**: {context}\n"
+                parts.append(f"  - **Context**: {context}\n")
             if source_author:
-                task_section += f"  - **From**: {source_author}\n"
+                parts.append(f"  - **From**: {source_author}\n")
             if channel and channel != "unknown":
-                task_section += f"  - **Channel**: #{channel}\n"
+                parts.append(f"  - **Channel**: #{channel}\n")
 
-            task_section += "\n"
+            parts.append("\n")
 
-        # Write combined content
-        final_content = existing_content + task_section
-
-        with open(daily_note_path, "w", encoding="utf-8") as f:
-            f.write(final_content)
+        with open(daily_note_path, "a", encoding="utf-8") as f:
+            f.write("".join(parts))
 
         logger.info(f"✅ Wrote {len(tasks)} tasks to {daily_note_path}")
 
@@ -489,6 +758,12 @@ tags: [slack, tasks, automated]
 
         iteration = 0
 
+        # Consecutive checks without new messages; drives the polling backoff
+        empty_streak = 0
+
+        # One worker keeps captures (and daily-note appends) in order
+        capture = ThreadPoolExecutor(max_workers=1)
+
         try:
             logger.info("Starting monitoring loop...")
 
@@ -512,15 +787,14 @@ tags: [slack, tasks, automated]
                         # Detect which messages might have tasks
                         potential_task_messages = self.detect_task_creating_messages(new_messages)
 
+                        # Messages with nothing to extract are done now; the rest
+                        # are marked seen once their capture succeeds
+                        self.mark_seen([msg for msg in new_messages if not msg.get("likely_task")])
+
                         if potential_task_messages:
-                            # Extract structured tasks using LLM
-                            tasks = self.extract_tasks_from_messages(potential_task_messages)
-
-                            if tasks:
-                                # Write to Obsidian
-                                self.write_tasks_to_obsidian(tasks)
-                            else:
-                                logger.info("No tasks extracted from messages")
+                            # Extract and write tasks in the background so the LLM
+                            # round-trip overlaps the next sleep and CDP check
+                            capture.submit(self._capture_tasks, potential_task_messages)
                         else:
                             logger.info("No potential task-creating messages found")
                     else:
@@ -529,9 +803,15 @@ tags: [slack, tasks, automated]
                     # Update last check time
                     self.last_check_time = datetime.now()
 
+                    # Re-check quickly while a conversation is active; back off
+                    # exponentially (up to MAX_POLL_INTERVAL) while it is quiet
+                    sleep_s, empty_streak = _next_poll_interval(
+                        self.check_interval, empty_streak, bool(new_messages)
+                    )
+
                     # Sleep until next check
-                    logger.info(f"Sleeping for {self.check_interval}s...")
-                    time.sleep(self.check_interval)
+                    logger.info("Sleeping for %ds...", sleep_s)
+                    time.sleep(sleep_s)
 
                 except KeyboardInterrupt:
                     raise
@@ -544,8 +824,41 @@ tags: [slack, tasks, automated]
         except KeyboardInterrupt:
             logger.info("\nMonitoring stopped by user")
         finally:
+            # Let queued captures finish before disconnecting
+            capture.shutdown(wait=True)
+            self.seen_state.flush()
             self.disconnect()
 
+    def _capture_tasks(self, messages: list[dict[str, Any]]):
+        """
+        Extract tasks from messages with the LLM and write them to Obsidian
+
+        Runs on the monitor loop's capture worker; errors are logged so one
+        failed capture does not stop later ones. The messages are marked seen
+        only once captured; after a failure the next check picks them up again.
+
+        Args:
+            messages: Messages likely to contain tasks
+        """
+        try:
+            # Extract structured tasks using LLM
+            tasks = self._extract_tasks(messages)
+
+            if tasks:
+                # Write to Obsidian
+                self.write_tasks_to_obsidian(tasks)
+            else:
+                logger.info("No tasks extracted from messages")
+
+        except Exception as e:
+            logger.error(f"Error capturing tasks: {e}")
+            logger.exception("Detailed error:")
+            self.release_pending(messages)
+            return
+
+        # Captured messages must stay seen even if the process is killed
+        self.mark_seen(messages, flush=True)
+
 
 def main():
     """Main entry point for CLI"""
@@ -572,6 +885,11 @@ def main():
         help="Check interval in seconds (default: 60)",
     )
     parser.add_argument("--no-llm", action="store_true", help="Disable LLM task extraction")
+    parser.add_argument(
+        "--similar-cache",
+        action="store_true",
+        help="Reuse extracted tasks for near-duplicate message batches",
+    )
     parser.add_argument(
         "--max-iterations",
         type=int,
@@ -586,6 +904,7 @@ def main():
         enable_llm=not args.no_llm,
         cdp_port=args.port,
         check_interval=args.interval,
+        similar_cache=args.similar_cache,
     )
 
     # Run monitoring loop
@@ -5,18 +5,39 @@ Maintains a persistent set of processed Granola document IDs for efficient
 duplicate prevention. Uses JSON for simplicity and portability.
 """
 
+import atexit
 import json
 import logging
+import time
+import weakref
+from collections.abc import KeysView
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Managers whose pending writes are flushed at exit; held weakly so a discarded
+# manager is not kept alive until shutdown
+_live_managers: "weakref.WeakSet[SyncStateManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_managers():
+    """Write any IDs still pending in live managers at interpreter exit"""
+    for manager in list(_live_managers):
+        manager.flush()
+
 
 class SyncStateManager:
     """Manage sync state including processed document IDs"""
 
+    # Marked IDs are written at most this often (seconds) unless flush() is called
+    SAVE_INTERVAL = 5.0
+
+    # A single batch at least this large is written immediately
+    SAVE_BATCH_SIZE = 100
+
     def __init__(self, state_file: Path | None = None):
         """
         Initialize sync state manager
@@ -29,6 +50,15 @@ class SyncStateManager:
 
         self.state_file = state_file
         self.state = self._load_state()
+
+        # State file size in bytes as last written (None until known)
+        self._file_size: int | None = None
+
+        # Writes are coalesced; callers flush() at their commit points and
+        # anything still pending is written at exit
+        self._dirty = False
+        self._last_save = time.monotonic()
+        _live_managers.add(self)
         logger.debug(f"SyncStateManager initialized with {len(self.state['processed_ids'])} IDs")
 
     def _load_state(self) -> dict[str, Any]:
@@ -36,15 +66,18 @@ class SyncStateManager:
         Load state from file
 
         Returns:
-            State dictionary with processed_ids set and metadata
+            State dictionary with processed_ids (ID -> time marked) and metadata
         """
         if self.state_file.exists():
             try:
                 with open(self.state_file) as f:
                     data = json.load(f)
 
-                # Convert list to set for O(1) lookups
-                processed_ids = set(data.get("processed_ids", []))
+                # ID -> time marked (epoch seconds) for O(1) lookups and pruning;
+                # older files hold a bare list, whose IDs count as marked now
+                processed_ids = data.get("processed_ids", {})
+                if isinstance(processed_ids, list):
+                    processed_ids = dict.fromkeys(processed_ids, int(time.time()))
 
                 state = {
                     "processed_ids": processed_ids,
@@ -63,7 +96,7 @@ class SyncStateManager:
         # Return empty state
         logger.info("Starting with empty state")
         return {
-            "processed_ids": set(),
+            "processed_ids": {},
             "last_pruned": None,
             "stats": {"total_processed": 0},
         }
@@ -74,18 +107,20 @@ class SyncStateManager:
             # Ensure logs directory exists
             self.state_file.parent.mkdir(parents=True, exist_ok=True)
 
-            # Convert set to list for JSON serialization
             data = {
-                "processed_ids": sorted(self.state["processed_ids"]),
+                "processed_ids": self.state["processed_ids"],
                 "last_pruned": self.state["last_pruned"],
                 "stats": self.state["stats"],
                 "updated_at": datetime.now().isoformat(),
             }
 
-            with open(self.state_file, "w") as f:
-                json.dump(data, f, indent=2)
+            # Compact encoding: the file is machine-read and the ID list dominates it
+            # (ASCII-only JSON, so characters written equals the file size in bytes)
+            self._file_size = self.state_file.write_text(json.dumps(data, separators=(",", ":")))
 
-            logger.debug(f"Saved state: {len(self.state['processed_ids'])} IDs")
+            self._dirty = False
+            self._last_save = time.monotonic()
+            logger.debug("Saved state: %d IDs", len(self.state["processed_ids"]))
 
         except Exception as e:
             logger.error(f"Error saving state: {e}")
@@ -102,6 +137,18 @@ class SyncStateManager:
         """
         return granola_id in self.state["processed_ids"]
 
+    def processed_ids_set(self) -> KeysView[str]:
+        """
+        Get a live set view of the processed document IDs
+
+        Callers filtering many documents can test membership directly instead of
+        calling is_processed per document.
+
+        Returns:
+            Set-like view of processed Granola document IDs
+        """
+        return self.state["processed_ids"].keys()
+
     def mark_processed(self, granola_id: str):
         """
         Mark a document as processed
@@ -110,10 +157,11 @@ class SyncStateManager:
             granola_id: Granola document ID
         """
         if granola_id not in self.state["processed_ids"]:
-            self.state["processed_ids"].add(granola_id)
+            self.state["processed_ids"][granola_id] = int(time.time())
             self.state["stats"]["total_processed"] += 1
-            self._save_state()
-            logger.debug(f"Marked processed: {granola_id}")
+            self._dirty = True
+            self._save_if_due()
+            logger.debug("Marked processed: %s", granola_id)
 
     def mark_batch_processed(self, granola_ids: list[str]):
         """
@@ -125,28 +173,56 @@ class SyncStateManager:
         new_ids = [gid for gid in granola_ids if gid not in self.state["processed_ids"]]
 
         if new_ids:
-            self.state["processed_ids"].update(new_ids)
+            self.state["processed_ids"].update(dict.fromkeys(new_ids, int(time.time())))
             self.state["stats"]["total_processed"] += len(new_ids)
+            self._dirty = True
+            self._save_if_due(len(new_ids))
+            logger.info("Marked %d documents as processed", len(new_ids))
+
+    def _save_if_due(self, batch_size: int = 1):
+        """
+        Save pending changes if SAVE_INTERVAL has passed or the batch is large
+
+        Args:
+            batch_size: Number of IDs just marked
+        """
+        if (
+            batch_size >= self.SAVE_BATCH_SIZE
+            or time.monotonic() - self._last_save >= self.SAVE_INTERVAL
+        ):
             self._save_state()
-            logger.info(f"Marked {len(new_ids)} documents as processed")
 
-    def prune_old_ids(self, days: int = 90):
+    def flush(self):
+        """Write any marked IDs not yet saved"""
+        if self._dirty:
+            self._save_state()
+
+    def prune_old_ids(self, days: int = 90) -> int:
         """
         Prune old IDs to keep state file small
 
-        Note: This is optional - the state file will only be ~11KB per year at 30 meetings/day.
-        Only call if you want to strictly limit state file size.
+        Note: This is optional for Granola document IDs, which never recur; a pruned
+        ID counts as unprocessed again.
 
         Args:
-            days: Keep IDs from last N days, remove older ones
+            days: Keep IDs marked in the last N days, remove older ones
+
+        Returns:
+            Number of IDs removed
         """
-        # This requires tracking timestamps per ID, which we're not doing by default
-        # for simplicity. The file will stay small enough without pruning.
-        logger.info("Pruning not implemented - state file is small enough without it")
+        cutoff = time.time() - days * 24 * 60 * 60
+        processed_ids = self.state["processed_ids"]
+        expired = [pid for pid, marked_at in processed_ids.items() if marked_at < cutoff]
+        for pid in expired:
+            del processed_ids[pid]
+
+        if expired:
+            logger.info("Pruned %d IDs older than %d days", len(expired), days)
 
         # Update last pruned timestamp
         self.state["last_pruned"] = datetime.now().isoformat()
         self._save_state()
+        return len(expired)
 
     def get_stats(self) -> dict[str, Any]:
         """
@@ -155,12 +231,14 @@ class SyncStateManager:
         Returns:
             Statistics dictionary
         """
+        # The file is only stat'ed until this manager has written it once
+        if self._file_size is None and self.state_file.exists():
+            self._file_size = self.state_file.stat().st_size
+
         return {
             "total_processed": self.state["stats"]["total_processed"],
             "ids_in_memory": len(self.state["processed_ids"]),
-            "state_file_size_kb": (
-                self.state_file.stat().st_size / 1024 if self.state_file.exists() else 0
-            ),
+            "state_file_size_kb": (self._file_size or 0) / 1024,
         }
 
 
@@ -186,6 +264,7 @@ if __name__ == "__main__":
         print("\nTest 2: Mark documents as processed")
         test_ids = ["doc-123", "doc-456", "doc-789"]
         manager.mark_batch_processed(test_ids)
+        manager.flush()
         print(f"✓ Marked {len(test_ids)} documents")
 
         # Test 3: Check duplicates
@@ -140,6 +140,24 @@ def test_credential_merging_logic(mock_granola_creds_path, mock_config_path):
     assert manager.get_user_info()["name"] == "Config User"  # Override applied
 
 
+def test_config_reloaded_after_change(mock_config_path):
+    """
+    Ensure repeated managers share parsed config without sharing mutable state,
+    and pick up edits to the file on disk.
+    """
+    mock_config_path.write_text(json.dumps({"user": {"name": "First User"}}))
+
+    manager = CredentialManager(config_path=str(mock_config_path))
+    manager.credentials["user"]["name"] = "Mutated"
+    # A second manager must not see the first one's in-memory edits
+    manager = CredentialManager(config_path=str(mock_config_path))
+    assert manager.get_user_info()["name"] == "First User"
+
+    mock_config_path.write_text(json.dumps({"user": {"name": "Second User, renamed"}}))
+    manager = CredentialManager(config_path=str(mock_config_path))
+    assert manager.get_user_info()["name"] == "Second User, renamed"
+
+
 def test_get_notion_credentials_success():
     """Test successful retrieval of complete and enabled Notion credentials."""
     creds = {
@@ -321,6 +321,32 @@ def test_extract_attendees_from_gcal_fallback():
     assert metadata["attendees"] == ["Gcal Alice", "bob@gcal.com"]
 
 
+def test_extract_attendees_deduplicates_creator():
+    """Test that a creator also listed as an attendee appears only once, first."""
+    doc = {
+        "id": "doc_dupe",
+        "people": {
+            "creator": {"name": "Alice"},
+            "attendees": [{"name": "Bob"}, {"name": "Alice"}, "Bob"],
+        },
+    }
+    metadata = MetadataExtractor.extract_metadata(doc)
+    assert metadata["attendees"] == ["Alice", "Bob"]
+
+
+def test_extract_attendees_ignores_string_creator_and_gcal_entries():
+    """Test that only people.attendees accepts bare strings; creator and gcal need dicts."""
+    doc = {"id": "doc_str", "people": {"creator": "Alice", "attendees": ["Bob"]}}
+    assert MetadataExtractor.extract_metadata(doc)["attendees"] == ["Bob"]
+
+    doc = {
+        "id": "doc_gcal_str",
+        "people": {"creator": "Alice"},
+        "google_calendar_event": {"attendees": ["carol@gcal.com", {"displayName": "Dan"}]},
+    }
+    assert MetadataExtractor.extract_metadata(doc)["attendees"] == ["Dan"]
+
+
 def test_extract_summary_and_overview():
     """Test that summary and overview fields are correctly identified."""
     doc_summary = {"summary": "This is the summary."}
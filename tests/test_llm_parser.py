@@ -0,0 +1,60 @@
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.llm_parser import LLMParser
+
+PARSED = {"action_items": [{"task": "Send the Q3 report"}], "decisions": []}
+METADATA = {"title": "Weekly Sync", "date": "2024-08-15", "attendees": ["Alice"]}
+
+
+def reply(text):
+    """A messages.create response holding the given text."""
+    return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+
+@pytest.fixture
+def parser():
+    """Fixture for a parser whose sync client is mocked."""
+    parser = LLMParser(api_key="test-key")
+    parser.client = MagicMock()
+    return parser
+
+
+def test_async_client_is_created_on_first_use(parser):
+    """Sync-only use never builds the async client."""
+    parser.client.messages.create.return_value = reply(json.dumps(PARSED))
+    parser.parse_meeting("- Alice to send the Q3 report", METADATA)
+    assert parser._async_client is None
+
+    assert parser.async_client is parser.async_client
+
+
+def test_sync_and_async_send_the_same_request(parser):
+    """Both paths build the same request and decode the reply the same way."""
+    parser.client.messages.create.return_value = reply(json.dumps(PARSED))
+    parser._async_client = MagicMock()
+    parser._async_client.messages.create = AsyncMock(return_value=reply(json.dumps(PARSED)))
+
+    sync_result = parser.parse_meeting("- Alice to send the Q3 report", METADATA)
+    async_result = asyncio.run(
+        parser.parse_meeting_async("- Alice to send the Q3 report", METADATA)
+    )
+
+    assert sync_result == async_result == PARSED
+    assert parser.client.messages.create.call_args == parser._async_client.messages.create.call_args
+
+
+def test_invalid_json_reply_raises(parser):
+    """A reply that is not JSON raises JSONDecodeError from either path."""
+    parser.client.messages.create.return_value = reply("not json")
+    parser._async_client = MagicMock()
+    parser._async_client.messages.create = AsyncMock(return_value=reply("not json"))
+
+    with pytest.raises(json.JSONDecodeError):
+        parser.parse_meeting("notes", METADATA)
+    with pytest.raises(json.JSONDecodeError):
+        asyncio.run(parser.parse_meeting_async("notes", METADATA))
@@ -0,0 +1,153 @@
+import os
+import re
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.llm_parser_perplexity import (
+    CACHE_TTL_SECONDS,
+    LLMParser,
+    _is_trivial_note,
+    _load_batch_note,
+    _load_note,
+    _split_frontmatter,
+)
+from src.obsidian_writer import ObsidianWriter
+
+
+@pytest.fixture
+def writer(tmp_path):
+    """Fixture for an ObsidianWriter writing into a temporary vault."""
+    manager = MagicMock()
+    manager.get_vault_path.return_value = tmp_path / "TestVault"
+    manager.get_user_info.return_value = {"name": "Test User", "email": "test@example.com"}
+    return ObsidianWriter(manager)
+
+
+@pytest.fixture
+def metadata():
+    """Fixture for minimal meeting metadata."""
+    return {
+        "granola_id": "doc_123",
+        "title": "Weekly Sync",
+        "created_at": "2024-08-15T14:30:00Z",
+        "attendees": ["alice@example.com"],
+    }
+
+
+def test_processor_note_without_content_is_trivial(writer, metadata):
+    """A processor-built note with no Granola content skips the LLM despite its headings."""
+    body = writer._generate_body(metadata, "_No content available_")
+    assert _is_trivial_note(body)
+
+
+def test_processor_note_with_action_items_is_not_trivial(writer, metadata):
+    """A short processor-built note with list items is still sent for parsing."""
+    body = writer._generate_body(metadata, "- Alice to send the Q3 report by Friday")
+    assert not _is_trivial_note(body)
+
+
+def test_long_bare_markdown_is_not_trivial():
+    """Markdown without the processor layout is checked as a whole."""
+    assert not _is_trivial_note("We discussed the roadmap in detail. " * 20)
+    assert _is_trivial_note("Quick chat, nothing decided.")
+
+
+def test_response_cache_expires_and_prunes_old_entries(tmp_path, monkeypatch):
+    """Expired cache entries are ignored on read and deleted by the next write."""
+    monkeypatch.delenv("LLM_PARSER_NOCACHE", raising=False)
+    parser = LLMParser(api_key="test-key", cache_dir=tmp_path)
+
+    stale = parser._cache_file("old prompt", None, parser.model, None)
+    stale.write_text('{"answer": 1}')
+    expired = time.time() - CACHE_TTL_SECONDS - 60
+    os.utime(stale, (expired, expired))
+    assert parser._read_cache(stale) is None
+
+    fresh = parser._cache_file("new prompt", None, parser.model, None)
+    parser._write_cache(fresh, '{"answer": 2}')
+
+    assert parser._read_cache(fresh) == {"answer": 2}
+    assert not stale.exists()
+
+
+def test_needs_consolidation_does_not_modify_parsed_data():
+    """The predicate only counts; near-duplicate merging happens in _dedup_overflow."""
+    parser = LLMParser(api_key="test-key", cache_dir=None)
+    limit = LLMParser.CONSOLIDATION_FALLBACK_THRESHOLD
+    actions = [{"task": "Send the Q3 report", "assignee": "Alice"}] * (limit + 1)
+    parsed = {"action_items": list(actions)}
+
+    assert parser._needs_consolidation(parsed)
+    assert parsed["action_items"] == actions
+
+    deduped = parser._dedup_overflow(parsed["action_items"])
+    assert len(deduped) == 1
+    assert not parser._needs_consolidation({"action_items": deduped})
+
+
+# The regex _split_frontmatter replaced; its groups are the reference behavior
+_FRONTMATTER_RE = re.compile(r"^---\n(.*?)\n---\n(.*)$", re.DOTALL)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "---\ntitle: Sync\n---\n# Body\n",
+        "---\ntitle: Sync\nnote: ends in ---\n---\nbody with\n---\nrule\n",
+        "---\n\n---\n",
+        "no frontmatter\n---\nhere\n",
+        "---\nunterminated: true\n",
+        "---\ntitle: x\n---",
+    ],
+)
+def test_split_frontmatter_matches_regex(content):
+    """The linear scan returns exactly what the original DOTALL regex matched."""
+    match = _FRONTMATTER_RE.match(content)
+    assert _split_frontmatter(content) == (match.groups() if match else None)
+
+
+def test_load_note_normalizes_crlf(tmp_path):
+    """Notes with Windows line endings still have their frontmatter parsed."""
+    note = tmp_path / "meeting.md"
+    note.write_bytes(b"---\r\ntitle: Sync\r\nattendees:\r\n- Alice\r\n---\r\n# Body\r\n")
+
+    metadata, body, frontmatter = _load_note(note)
+
+    assert metadata == {"title": "Sync", "attendees": ["Alice"]}
+    assert body == "# Body\n"
+    assert frontmatter == "title: Sync\nattendees:\n- Alice"
+
+
+def test_load_note_without_frontmatter_uses_file_name(tmp_path):
+    """A note without frontmatter is returned whole, titled after its file."""
+    note = tmp_path / "Standup.md"
+    note.write_text("Just notes\n")
+
+    assert _load_note(note) == ({"title": "Standup"}, "Just notes\n", None)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"\xff\xfe not utf-8",
+        b"---\ntitle: [unclosed\n---\nbody\n",
+        b"---\n- a list\n---\nbody\n",
+        b"---\n\n---\nbody\n",
+    ],
+)
+def test_batch_note_that_cannot_be_parsed_is_skipped(tmp_path, content):
+    """Undecodable files and non-mapping frontmatter are skipped instead of raising."""
+    note = tmp_path / "broken.md"
+    note.write_bytes(content)
+
+    assert _load_batch_note(note) is None
+
+
+def test_batch_note_with_mapping_frontmatter_is_loaded(tmp_path):
+    """A well-formed note loads exactly as _load_note returns it."""
+    note = tmp_path / "meeting.md"
+    note.write_text("---\ntitle: Sync\n---\n# Body\n")
+
+    assert _load_batch_note(note) == _load_note(note)
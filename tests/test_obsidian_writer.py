@@ -1,10 +1,13 @@
 import pytest
 from unittest.mock import MagicMock, patch
 from pathlib import Path
+from types import SimpleNamespace
+import os
 import yaml
 from freezegun import freeze_time
 
-from src.obsidian_writer import ObsidianWriter
+from src.obsidian_writer import ObsidianWriter, _atomic_write
+from src.processor import GranolaProcessor
 
 # --- Fixtures ---
 
@@ -129,6 +132,19 @@ def test_build_header(writer, sample_metadata):
     assert "[Calendar Event](https://meet.com/xyz-abc)" in header
 
 
+def test_date_formatting_keeps_each_utc_offset(writer, sample_metadata):
+    """Test that the same instant in different timezones renders its own local time."""
+    utc_metadata = {**sample_metadata, "created_at": "2025-10-01T14:00:00Z"}
+    eastern_metadata = {**sample_metadata, "created_at": "2025-10-01T10:00:00-04:00"}
+
+    utc_frontmatter = yaml.safe_load(writer._build_frontmatter(utc_metadata))
+    eastern_frontmatter = yaml.safe_load(writer._build_frontmatter(eastern_metadata))
+
+    assert utc_frontmatter["time"] == "14:00"
+    assert eastern_frontmatter["time"] == "10:00"
+    assert "at 10:00 AM" in writer._build_header(eastern_metadata)
+
+
 @freeze_time("2024-08-15 11:00:00")
 @patch("src.obsidian_writer.MetadataExtractor.extract_metadata")
 @patch("src.obsidian_writer.ProseMirrorConverter.convert")
@@ -201,4 +217,129 @@ def test_write_meeting_note_extraction_fails(mock_extract, writer):
     """Test that the function returns None if metadata extraction fails."""
     doc = {"id": "doc_fail"}
     filepath = writer.write_meeting_note(doc)
-    assert filepath is None
\ No newline at end of file
+    assert filepath is None
+
+
+@patch("src.obsidian_writer.MetadataExtractor.extract_metadata", side_effect=OSError("Disk full"))
+def test_repeated_failure_logs_one_traceback(mock_extract, writer, caplog):
+    """Test that a repeated failure logs its traceback once until the log is reset."""
+    for doc_id in ("doc_a", "doc_b", "doc_c"):
+        assert writer.write_meeting_note({"id": doc_id}) is None
+
+    tracebacks = [r for r in caplog.records if r.exc_info]
+    errors = [r for r in caplog.records if "Disk full" in r.getMessage()]
+    assert len(tracebacks) == 1
+    assert len(errors) == 3
+
+    writer.reset_failure_log()
+    caplog.clear()
+    writer.write_meeting_note({"id": "doc_d"})
+    assert len([r for r in caplog.records if r.exc_info]) == 1
+
+
+def test_processor_write_failures_share_traceback_dedupe(writer, caplog):
+    """Test that the processor's per-document handler also logs each traceback once."""
+    processor = SimpleNamespace(writer=writer)
+    writer.build_note = MagicMock(return_value=(Path("note.md"), {}, ""))
+    writer.render_note = MagicMock(side_effect=ValueError("bad frontmatter"))
+
+    for doc_id in ("doc_a", "doc_b"):
+        note, error = GranolaProcessor._write_document(processor, {"id": doc_id}, "now")
+        assert note is None
+        assert error == f"Error processing {doc_id}: bad frontmatter"
+
+    assert len([r for r in caplog.records if r.exc_info]) == 1
+
+
+@pytest.mark.parametrize(
+    "fm",
+    [
+        # Tabs force a double-quoted scalar, which libyaml and SafeDumper fold differently
+        {"meeting": "Sync", "summary": "Owner\tstatus\tnext step, wrapped past the width. " * 3},
+        # Non-BMP characters take the pure-Python fallback
+        {"meeting": "🚀 Launch review: \"alpha\" vs 'beta'", "summary": "first\nsecond: colon"},
+        {"meeting": "Plain", "attendees": ["[[Alice Smith]]", "[[Bob Jones]]"], "duration": None},
+    ],
+)
+def test_dump_frontmatter_round_trips_like_safe_dumper(writer, fm):
+    """Test that dumped frontmatter loads back to the same values, in order, as SafeDumper's.
+
+    Line folding of long double-quoted scalars may differ byte-wise between the
+    libyaml and pure-Python emitters; only the loaded values are guaranteed equal.
+    """
+    dumped = writer._dump_frontmatter(fm)
+    reference = yaml.dump(
+        fm, Dumper=yaml.SafeDumper, default_flow_style=False, allow_unicode=True, sort_keys=False
+    )
+
+    loaded = yaml.safe_load(dumped)
+    assert loaded == fm == yaml.safe_load(reference)
+    assert list(loaded) == list(fm)
+    assert "\\U" not in dumped
+
+
+def test_atomic_write_replaces_file_and_leaves_no_temp(tmp_path):
+    """Test that _atomic_write publishes the full content and cleans up its temp file."""
+    target = tmp_path / "note.md"
+    target.write_text("old content")
+
+    _atomic_write(target, "new content ✓".encode())
+
+    assert target.read_text(encoding="utf-8") == "new content ✓"
+    assert [p.name for p in tmp_path.iterdir()] == ["note.md"]
+
+
+def test_atomic_write_failure_keeps_original(tmp_path):
+    """Test that a failed rename leaves the original file intact and removes the temp file."""
+    target = tmp_path / "note.md"
+    target.write_text("original")
+
+    with (
+        patch.object(Path, "replace", side_effect=OSError("rename failed")),
+        pytest.raises(OSError),
+    ):
+        _atomic_write(target, b"partial")
+
+    assert target.read_text() == "original"
+    assert [p.name for p in tmp_path.iterdir()] == ["note.md"]
+
+
+def test_render_note_output(writer):
+    """Test that render_note wraps the frontmatter in --- fences directly before the body."""
+    content = writer.render_note({"date": "2024-08-15", "meeting": "Sync"}, "\n# Sync\n")
+
+    assert content == "---\ndate: '2024-08-15'\nmeeting: Sync\n---\n\n# Sync\n"
+
+
+def test_sync_notes_fsyncs_each_note_then_inbox_once(writer):
+    """Test that sync_notes fsyncs every written note and the inbox directory once."""
+    notes = [writer.inbox_path / "a.md", writer.inbox_path / "b.md"]
+    for note in notes:
+        note.write_text("content")
+    missing = writer.inbox_path / "gone.md"
+
+    # Map each opened descriptor back to its path so fsync calls can be checked
+    opened = {}
+    synced = []
+    real_open = os.open
+
+    def tracking_open(path, flags, *args):
+        fd = real_open(path, flags, *args)
+        opened[fd] = Path(path)
+        return fd
+
+    with (
+        patch("src.obsidian_writer.os.open", side_effect=tracking_open),
+        patch("src.obsidian_writer.os.fsync", side_effect=lambda fd: synced.append(opened[fd])),
+    ):
+        # A note that vanished is logged and skipped, not raised
+        writer.sync_notes([*notes, missing])
+
+    assert synced == [*notes, writer.inbox_path]
+
+
+def test_sync_notes_without_notes_does_nothing(writer):
+    """Test that an empty run does not touch the filesystem."""
+    with patch("src.obsidian_writer.os.fsync") as mock_fsync:
+        writer.sync_notes([])
+    mock_fsync.assert_not_called()
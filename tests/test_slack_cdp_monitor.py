@@ -0,0 +1,284 @@
+import json
+import shutil
+import subprocess
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+# The monitor exits at import time without its CDP client
+pytest.importorskip("pychrome")
+
+import src.slack_cdp_monitor as slack_cdp_monitor  # noqa: E402
+from src.slack_cdp_monitor import (  # noqa: E402
+    _EXTRACT_MESSAGES_JS,
+    EXTRACT_ATTEMPTS,
+    MAX_POLL_INTERVAL,
+    MIN_POLL_INTERVAL,
+    SlackCDPMonitor,
+    _next_poll_interval,
+)
+
+
+@pytest.fixture
+def monitor(tmp_path, monkeypatch):
+    """Fixture for a monitor with a scripted LLM client."""
+    monkeypatch.setattr(slack_cdp_monitor, "SEEN_STATE_FILE", tmp_path / ".slack_seen.json")
+    monitor = SlackCDPMonitor(str(tmp_path), enable_llm=False)
+    monitor.llm_parser = SimpleNamespace(client=MagicMock(), model="test-model")
+    return monitor
+
+
+def script_replies(monitor, *replies):
+    """Make the monitor's LLM client return the given reply texts in order."""
+    monitor.llm_parser.client.chat.completions.create.side_effect = [
+        SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=reply))])
+        for reply in replies
+    ]
+
+
+MESSAGES = [{"author": "Alice", "timestamp": "10:00", "content": "Can you review the PR today?"}]
+
+
+def test_poll_interval_backs_off_while_idle():
+    """Consecutive empty checks double the sleep up to MAX_POLL_INTERVAL."""
+    streak = 0
+    sleeps = []
+    for _ in range(7):
+        sleep_s, streak = _next_poll_interval(60, streak, found_new=False)
+        sleeps.append(sleep_s)
+
+    assert sleeps == [60, 120, 240, 480, MAX_POLL_INTERVAL, MAX_POLL_INTERVAL, MAX_POLL_INTERVAL]
+    # The streak stops growing once the cap is reached
+    assert streak == 4
+
+
+def test_poll_interval_resets_on_new_messages():
+    """New messages reset the backoff and re-check at a quarter interval."""
+    assert _next_poll_interval(60, 4, found_new=True) == (15, 0)
+    assert _next_poll_interval(8, 2, found_new=True) == (MIN_POLL_INTERVAL, 0)
+
+
+def test_poll_interval_respects_long_check_interval():
+    """A check_interval above MAX_POLL_INTERVAL is used as the cap instead."""
+    assert _next_poll_interval(900, 0, found_new=False) == (900, 0)
+
+
+@pytest.mark.parametrize(
+    "reply",
+    [
+        "not json",
+        json.dumps([{"task": "bare list"}]),
+        json.dumps({"tasks": "not a list"}),
+        json.dumps({"tasks": [{"assignee": "Bob"}]}),
+    ],
+)
+def test_decode_tasks_rejects_malformed_replies(reply):
+    """Replies that are not a {"tasks": [...]} object with task strings are rejected."""
+    with pytest.raises(ValueError):
+        SlackCDPMonitor._decode_tasks(reply)
+
+
+def test_extraction_retries_invalid_reply_with_feedback(monitor):
+    """An invalid reply is sent back with its error and the corrected reply is used."""
+    tasks = [{"task": "Review the PR", "assignee": "Bob"}]
+    script_replies(monitor, '{"tasks": [{"assignee": "Bob"}]}', json.dumps({"tasks": tasks}))
+
+    assert monitor.extract_tasks_from_messages(MESSAGES) == tasks
+
+    create = monitor.llm_parser.client.chat.completions.create
+    assert create.call_count == 2
+    retry_chat = create.call_args_list[1].kwargs["messages"]
+    assert retry_chat[-2] == {"role": "assistant", "content": '{"tasks": [{"assignee": "Bob"}]}'}
+    assert retry_chat[-1]["content"].startswith("Your output was invalid:")
+    assert create.call_args.kwargs["response_format"]["type"] == "json_schema"
+
+
+def test_extraction_gives_up_after_max_attempts(monitor):
+    """A batch is dropped only after EXTRACT_ATTEMPTS invalid replies."""
+    script_replies(monitor, *["not json"] * EXTRACT_ATTEMPTS)
+
+    assert monitor.extract_tasks_from_messages(MESSAGES) == []
+    assert monitor.llm_parser.client.chat.completions.create.call_count == EXTRACT_ATTEMPTS
+
+
+def visible(*texts):
+    """Messages as the extraction script returns them, with undated IDs."""
+    return [
+        {"id": f"Alice-09:00-{text}", "author": "Alice", "timestamp": "09:00", "content": text}
+        for text in texts
+    ]
+
+
+def test_same_message_on_a_later_day_is_new(monitor, monkeypatch):
+    """IDs carry the day, so a repeat of yesterday's message at the same time is new."""
+    monitor.mark_seen(monitor.filter_new_messages(visible("standup")))
+    assert monitor.filter_new_messages(visible("standup")) == []
+
+    class Tomorrow(date):
+        @classmethod
+        def today(cls):
+            return date.fromordinal(date.today().toordinal() + 1)
+
+    monkeypatch.setattr(slack_cdp_monitor, "date", Tomorrow)
+    assert len(monitor.filter_new_messages(visible("standup"))) == 1
+
+
+def test_failed_capture_leaves_messages_unseen(monitor):
+    """Messages stay pending while captured and return to unseen if extraction fails."""
+    script_replies(monitor, *["not json"] * EXTRACT_ATTEMPTS)
+    pending = monitor.filter_new_messages(visible("Can you review the PR?"))
+    assert monitor.filter_new_messages(visible("Can you review the PR?")) == []
+
+    monitor._capture_tasks(pending)
+
+    assert not monitor.seen_message_ids
+    assert len(monitor.filter_new_messages(visible("Can you review the PR?"))) == 1
+
+
+def test_captured_messages_are_seen_after_restart(monitor, tmp_path):
+    """A successful capture writes its seen IDs at once, without waiting for a flush."""
+    script_replies(monitor, json.dumps({"tasks": [{"task": "Review the PR"}]}))
+    monitor._capture_tasks(monitor.filter_new_messages(visible("Can you review the PR?")))
+
+    restarted = SlackCDPMonitor(str(tmp_path), enable_llm=False)
+    assert restarted.filter_new_messages(visible("Can you review the PR?")) == []
+
+
+# The extraction script before the container fast path; its ids are the reference
+_WALK_ALL_ELEMENTS_JS = r"""
+(() => {
+    const messages = [];
+    const messagePane = document.querySelector('.p-message_pane') ||
+                       document.querySelector('.c-message_list');
+    if (!messagePane) {
+        return { error: 'Message pane not found' };
+    }
+    const timePattern = /\d{1,2}:\d{2}\s*(AM|PM)?/i;
+    messagePane.querySelectorAll('*').forEach(el => {
+        const text = el.innerText || '';
+        if (timePattern.test(text) && text.length < 100) {
+            let parent = el.parentElement;
+            for (let i = 0; i < 5 && parent; i++) {
+                const parentText = parent.innerText || '';
+                if (parentText.length > 20 &&
+                    parentText.length < 2000 &&
+                    timePattern.test(parentText)) {
+                    const message = {
+                        fullText: parentText,
+                        timestamp: text.match(timePattern)?.[0],
+                    };
+                    const lines = parentText.split('\n');
+                    if (lines.length > 1) {
+                        message.author = lines[0];
+                        message.content = lines.slice(2).join('\n');
+                    }
+                    message.id = (message.author || 'unknown') + '-' +
+                                (message.timestamp || 'no-time') + '-' +
+                                parentText.substring(0, 50).replace(/[^a-zA-Z0-9]/g, '');
+                    messages.push(message);
+                    break;
+                }
+                parent = parent.parentElement;
+            }
+        }
+    });
+    const seen = new Set();
+    const unique = messages.filter(msg => {
+        const key = msg.fullText.substring(0, 100);
+        if (seen.has(key)) return false;
+        seen.add(key);
+        return true;
+    });
+    return { found: unique.length, messages: unique };
+})()
+"""
+
+# Minimal DOM for the extraction scripts: innerText joins children with a
+# newline, or a space for inline elements; selectors are ".class",
+# "[data-qa=...]" and "*"
+_FAKE_DOM_JS = r"""
+const build = (spec, parent) => {
+    const el = {
+        classes: spec.classes || [], qa: spec.qa, parentElement: parent, children: [],
+    };
+    el.children = (spec.children || []).map(child => build(child, el));
+    Object.defineProperty(el, 'innerText', {
+        get: () => [spec.text || '', ...el.children.map(c => c.innerText)]
+            .filter(Boolean).join(spec.inline ? ' ' : '\n'),
+    });
+    el.matches = sel => sel === '*' ||
+        (sel.startsWith('.') && el.classes.includes(sel.slice(1))) ||
+        sel === `[data-qa="${el.qa}"]`;
+    el.querySelectorAll = selectors => {
+        const found = [];
+        const visit = node => node.children.forEach(child => {
+            if (selectors.split(',').some(sel => child.matches(sel.trim()))) found.push(child);
+            visit(child);
+        });
+        visit(el);
+        return found;
+    };
+    el.querySelector = sel => el.querySelectorAll(sel)[0] || null;
+    return el;
+};
+const root = build(JSON.parse(process.argv[1]), null);
+global.document = { querySelector: sel => root.querySelector(sel) };
+process.stdout.write(JSON.stringify(eval(require('fs').readFileSync(0, 'utf8'))));
+"""
+
+
+def slack_message(author, time, text, container, gutter="", footer=""):
+    """A Slack message row, with or without Slack's container markers."""
+    markers = {"qa": "message_container", "classes": ["c-message_kit__background"]}
+    header = {"inline": True, "children": [{"text": author}, {"text": time}]} if author else {}
+    return {
+        "classes": ["c-virtual_list__item"],
+        "children": [
+            {
+                **(markers if container else {}),
+                "children": [
+                    {"classes": ["c-message_kit__gutter"], "text": gutter},
+                    {"children": [header, {"text": text}]},
+                    {"text": footer},
+                ],
+            }
+        ],
+    }
+
+
+def run_extraction(script, rows):
+    """Run an extraction script in node against a message pane of the given rows."""
+    pane = {"children": [{"classes": ["p-message_pane"], "children": rows}]}
+    result = subprocess.run(
+        ["node", "-e", _FAKE_DOM_JS, json.dumps(pane)],
+        input=script,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout)
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="needs node to run the script")
+@pytest.mark.parametrize("container", [True, False])
+def test_extraction_ids_match_element_walk(container):
+    """Both paths produce the ids the all-element walk did, so seen IDs stay valid."""
+    rows = [
+        slack_message("Alice", "10:42 AM", "Can you review the deploy PR?", container),
+        # A header over 20 characters ends the walk before the message body
+        slack_message(
+            "Alice Smithson-Whitaker", "10:44 AM", "Please check the rollback", container
+        ),
+        # Continuation messages show their time in the gutter, not a header
+        slack_message("", "", "Also the staging credentials", container, gutter="10:46"),
+        slack_message("Bob", "10:50 AM", "Deploying now", container, footer="3 replies 11:20 AM"),
+        # Real panes hold over 2000 characters, so no walk ends at the whole pane
+        {"text": "earlier history " * 150},
+    ]
+
+    reference = run_extraction(_WALK_ALL_ELEMENTS_JS, rows)["messages"]
+    messages = run_extraction(_EXTRACT_MESSAGES_JS, rows)["messages"]
+
+    assert {msg["id"] for msg in messages} == {msg["id"] for msg in reference}
@@ -0,0 +1,109 @@
+import gc
+import json
+import weakref
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.processor import GranolaProcessor
+from src.sync_state import SyncStateManager, _flush_live_managers
+
+
+@pytest.fixture
+def state_file(tmp_path: Path) -> Path:
+    """Fixture for a state file path that does not exist yet."""
+    return tmp_path / "logs" / ".sync_state.json"
+
+
+def saved_ids(state_file: Path) -> set[str]:
+    """Read the processed IDs currently on disk."""
+    return set(json.loads(state_file.read_text())["processed_ids"])
+
+
+def test_small_batch_is_coalesced_until_flush(state_file):
+    """A batch below SAVE_BATCH_SIZE stays in memory until flush() or the interval."""
+    manager = SyncStateManager(state_file)
+    manager.mark_batch_processed(["doc-1", "doc-2"])
+
+    assert manager.is_processed("doc-1")
+    assert not state_file.exists()
+
+    manager.flush()
+    assert saved_ids(state_file) == {"doc-1", "doc-2"}
+
+
+def test_large_batch_is_saved_immediately(state_file):
+    """A batch of at least SAVE_BATCH_SIZE IDs is written without waiting."""
+    manager = SyncStateManager(state_file)
+    ids = [f"doc-{i}" for i in range(SyncStateManager.SAVE_BATCH_SIZE)]
+    manager.mark_batch_processed(ids)
+
+    assert saved_ids(state_file) == set(ids)
+
+
+def test_pending_ids_are_saved_once_interval_passes(state_file):
+    """Marks after SAVE_INTERVAL has elapsed write everything still pending."""
+    manager = SyncStateManager(state_file)
+    manager.mark_processed("doc-1")
+    assert not state_file.exists()
+
+    # Simulate the interval elapsing since the last save
+    manager._last_save -= SyncStateManager.SAVE_INTERVAL
+    manager.mark_processed("doc-2")
+
+    assert saved_ids(state_file) == {"doc-1", "doc-2"}
+
+
+def test_processor_batch_commit_is_written_immediately(state_file):
+    """Processor batch commits reach disk at once, not at the next coalesced save."""
+    manager = SyncStateManager(state_file)
+    processor = SimpleNamespace(state=manager)
+    ids = [f"doc-{i}" for i in range(GranolaProcessor.STATE_FLUSH_INTERVAL)]
+    buffered = list(ids)
+
+    GranolaProcessor._flush_processed(processor, buffered)
+
+    assert buffered == []
+    assert saved_ids(state_file) == set(ids)
+
+
+def test_prune_old_ids_removes_only_expired(state_file):
+    """prune_old_ids drops IDs marked before the cutoff and saves the rest."""
+    manager = SyncStateManager(state_file)
+    manager.mark_batch_processed(["old", "new"])
+    manager.state["processed_ids"]["old"] -= 3 * 24 * 60 * 60
+
+    assert manager.prune_old_ids(days=2) == 1
+    assert not manager.is_processed("old")
+    assert saved_ids(state_file) == {"new"}
+
+
+def test_legacy_id_list_is_loaded(state_file):
+    """State files holding a bare ID list still load, timestamped as of loading."""
+    state_file.parent.mkdir(parents=True)
+    state_file.write_text(json.dumps({"processed_ids": ["doc-1", "doc-2"]}))
+
+    manager = SyncStateManager(state_file)
+
+    assert manager.is_processed("doc-1")
+    assert manager.prune_old_ids(days=1) == 0
+    assert saved_ids(state_file) == {"doc-1", "doc-2"}
+
+
+def test_exit_hook_flushes_pending_ids(state_file):
+    """The shared exit hook writes IDs still pending in live managers."""
+    manager = SyncStateManager(state_file)
+    manager.mark_processed("doc-1")
+    assert not state_file.exists()
+
+    _flush_live_managers()
+    assert saved_ids(state_file) == {"doc-1"}
+
+
+def test_exit_hook_does_not_keep_managers_alive(state_file):
+    """Discarded managers can be garbage collected before exit."""
+    ref = weakref.ref(SyncStateManager(state_file))
+    gc.collect()
+
+    assert ref() is None